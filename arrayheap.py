@@ -0,0 +1,488 @@
+import copy
+import math
+from array import array
+from fibonacciHeap import FibHeap, LOG_PHI
+
+NIL = -1  # handle value meaning "no node"
+
+
+class ArrayFibHeap:
+    """
+        A Fibonacci heap stored as parallel typed arrays (struct-of-arrays).
+
+        Instead of Node objects, every entry is an integer handle that indexes the arrays
+        below. Links between entries are handles too, so the heap holds no per-entry Python
+        objects apart from the caller's keys. That keeps memory small (43 bytes of array
+        storage per entry plus an 8-byte key list slot, against roughly 150 bytes for a
+        FibHeap node and its index entry) and makes copying or snapshotting the whole
+        heap a handful of array copies.
+
+        The operations mirror FibHeap, with handles in place of nodes:
+        insert, getMin, extractMin, fib_Union, fib_decrease and delete.
+
+        By default keys are opaque payloads and may repeat. With intern_keys=True every
+        key is interned to its handle, a dense integer id: keys must be hashable and
+        unique, and handle_of, decrease_key and `in` find an entry by key. Past that one
+        dict lookup the heap works on the integer id only. The dict adds about 80
+        bytes per entry at 200,000 keys, so interning is opt-in.
+
+        Attributes:
+            parent, child, left, right (array('q')): Structure links; NIL when absent.
+            degree (array('h')): The number of children of each entry; -1 marks a free slot.
+            mark (bytearray): 1 when an entry has lost a child since it was linked.
+            priority (array('d')): The priority of each entry.
+            keys (list): The caller's key for each handle; None for free slots.
+            free (list): Released handles that insert reuses before growing the arrays.
+            ids (dict): Maps every key to its handle when keys are interned, else None.
+            mMinimum (int): The handle of the minimum entry, or NIL when empty.
+            node_count (int): The number of entries in the heap.
+    """
+    # keys and priorities are validated exactly like FibHeap does it
+    checkKey = FibHeap.checkKey
+    checkPriority = FibHeap.checkPriority
+
+    def __init__(self, intern_keys=False):
+        self.parent = array("q")
+        self.child = array("q")
+        self.left = array("q")
+        self.right = array("q")
+        self.degree = array("h")
+        self.mark = bytearray()
+        self.priority = array("d")
+        self.keys = []
+        self.free = []
+        self.ids = {} if intern_keys else None
+        self.mMinimum = NIL
+        self.node_count = 0
+
+
+    def insert(self, key, priority):
+        """
+        Inserts a new entry as a singleton root.
+
+        Args:
+            key: The caller's key, stored alongside the handle.
+            priority (float): The priority of the entry.
+
+        Raises:
+            ValueError: If the priority is None, not a number or NaN, or keys are
+                interned and the key is invalid or already present.
+
+        Returns:
+            int: The handle of the new entry.
+        """
+        ids = self.ids
+        if ids is not None:
+            self.checkKey(key)
+            if key in ids:
+                raise ValueError(f"Duplicate key '{key}' is not allowed.")
+        priority = self.checkPriority(priority)
+        if self.free:
+            h = self.free.pop()
+            self.parent[h] = self.child[h] = NIL
+            self.degree[h] = 0
+            self.mark[h] = 0
+            self.priority[h] = priority
+            self.keys[h] = key
+        else:
+            h = len(self.keys)
+            self.parent.append(NIL)
+            self.child.append(NIL)
+            self.left.append(h)
+            self.right.append(h)
+            self.degree.append(0)
+            self.mark.append(0)
+            self.priority.append(priority)
+            self.keys.append(key)
+        self.left[h] = self.right[h] = h
+        if ids is not None:
+            ids[key] = h
+        self.add_root(h)
+        self.node_count += 1
+        return h
+
+
+    def add_root(self, h):
+        """
+        Splices the singleton circle h into the root list and updates the minimum.
+
+        Args:
+            h (int): A handle whose left and right point to itself.
+        """
+        m = self.mMinimum
+        if m == NIL:
+            self.mMinimum = h
+            return
+        self.splice(m, h)
+        if self.priority[h] < self.priority[m]:
+            self.mMinimum = h
+
+
+    def splice(self, a, b):
+        """
+        Concatenates the circular list containing b into the one containing a, after a.
+
+        Args:
+            a (int): A handle in the first circle.
+            b (int): A handle in the second circle.
+        """
+        left, right = self.left, self.right
+        a_next = right[a]
+        b_prev = left[b]
+        right[a] = b
+        left[b] = a
+        right[b_prev] = a_next
+        left[a_next] = b_prev
+
+
+    def isEmpty(self):
+        """
+        Returns:
+            bool: True if the heap has no entries.
+        """
+        return self.mMinimum == NIL
+
+
+    def getMin(self):
+        """
+        Returns:
+            int: The handle of the minimum entry, or None if the heap is empty.
+        """
+        if self.mMinimum == NIL:
+            return None
+        return self.mMinimum
+
+
+    def key_of(self, h):
+        """
+        Returns:
+            The key stored for handle h.
+        """
+        return self.keys[h]
+
+
+    def handle_of(self, key):
+        """
+        Returns the handle of key; requires intern_keys.
+
+        Raises:
+            ValueError: If keys are not interned or key is not in the heap.
+
+        Returns:
+            int: The handle of the entry stored under key.
+        """
+        if self.ids is None:
+            raise ValueError("Key lookup needs a heap created with intern_keys=True.")
+        h = self.ids.get(key)
+        if h is None:
+            raise ValueError(f"Key '{key}' is not in the heap.")
+        return h
+
+
+    def __contains__(self, key):
+        if self.ids is None:
+            raise ValueError("Key lookup needs a heap created with intern_keys=True.")
+        return key in self.ids
+
+
+    def __len__(self):
+        return self.node_count
+
+
+    def decrease_key(self, key, priority):
+        """
+        Decreases the priority stored under key; requires intern_keys.
+
+        Returns:
+            int: The handle of the entry.
+        """
+        h = self.handle_of(key)
+        self.fib_decrease(h, priority)
+        return h
+
+
+    def priority_of(self, h):
+        """
+        Returns:
+            float: The priority stored for handle h.
+        """
+        return self.priority[h]
+
+
+    def extractMin(self):
+        """
+        Removes the minimum entry and consolidates the root list.
+
+        The handle of the removed entry is released for reuse, so the key and
+        priority are returned instead.
+
+        Raises:
+            ValueError: If the heap is empty.
+
+        Returns:
+            tuple: The (key, priority) of the removed entry.
+        """
+        z = self.mMinimum
+        if z == NIL:
+            raise ValueError("Empty Heap")
+        parent, right = self.parent, self.right
+
+        # promote the children of z to the root list
+        c = self.child[z]
+        if c != NIL:
+            x = c
+            while True:
+                parent[x] = NIL
+                x = right[x]
+                if x == c:
+                    break
+            self.splice(z, c)
+            self.child[z] = NIL
+
+        # unlink z from the root list
+        if right[z] == z:
+            self.mMinimum = NIL
+        else:
+            self.right[self.left[z]] = right[z]
+            self.left[right[z]] = self.left[z]
+            self.mMinimum = right[z]
+            self.consolidate()
+
+        self.node_count -= 1
+        entry = (self.keys[z], self.priority[z])
+        if self.ids is not None:
+            del self.ids[entry[0]]
+        self.keys[z] = None
+        self.degree[z] = -1
+        self.free.append(z)
+        return entry
+
+
+    def consolidate(self):
+        """
+        Links roots of equal degree until every root has a distinct degree.
+
+        The roots are read once into a list, linked through a degree table sized by
+        the log_phi(n) degree bound, and the new root list and minimum are built from
+        the table in a single pass.
+        """
+        left, right, priority = self.left, self.right, self.priority
+        degree = self.degree
+
+        roots = []
+        start = x = self.mMinimum
+        while True:
+            roots.append(x)
+            x = right[x]
+            if x == start:
+                break
+
+        table = [NIL] * (int(math.log(self.node_count + 1) / LOG_PHI) + 2)
+        for x in roots:
+            d = degree[x]
+            while table[d] != NIL:
+                y = table[d]
+                if priority[y] < priority[x]:
+                    x, y = y, x
+                self.link(y, x)
+                table[d] = NIL
+                d += 1
+            table[d] = x
+
+        self.mMinimum = NIL
+        for x in table:
+            if x != NIL:
+                left[x] = right[x] = x
+                self.add_root(x)
+
+
+    def link(self, y, x):
+        """
+        Makes root y a child of root x. The caller rebuilds the root list afterwards.
+
+        Args:
+            y (int): The root with the larger priority.
+            x (int): The root that becomes y's parent.
+        """
+        c = self.child[x]
+        if c == NIL:
+            self.child[x] = y
+            self.left[y] = self.right[y] = y
+        else:
+            self.left[y] = self.right[y] = y
+            self.splice(c, y)
+        self.parent[y] = x
+        self.degree[x] += 1
+        self.mark[y] = 0
+
+
+    def fib_decrease(self, h, priority):
+        """
+        Decreases the priority of entry h, cutting it from its parent if heap order breaks.
+
+        Args:
+            h (int): The handle of the entry.
+            priority (float): The new priority; ignored if larger than the current one.
+        """
+        priority = self.checkPriority(priority)
+        if priority > self.priority[h]:
+            return
+        self.priority[h] = priority
+        y = self.parent[h]
+        if y != NIL and priority < self.priority[y]:
+            self.cut(h, y)
+            self.cascadingCut(y)
+        if priority < self.priority[self.mMinimum]:
+            self.mMinimum = h
+
+
+    def cut(self, x, y):
+        """
+        Moves x from the child list of y to the root list.
+
+        Args:
+            x (int): The child being cut.
+            y (int): Its parent.
+        """
+        left, right = self.left, self.right
+        if right[x] == x:
+            self.child[y] = NIL
+        else:
+            right[left[x]] = right[x]
+            left[right[x]] = left[x]
+            if self.child[y] == x:
+                self.child[y] = right[x]
+        self.degree[y] -= 1
+        left[x] = right[x] = x
+        self.splice(self.mMinimum, x)
+        self.parent[x] = NIL
+        self.mark[x] = 0
+
+
+    def cascadingCut(self, y):
+        """
+        Walks up from y, cutting marked ancestors and marking the first unmarked one.
+
+        Args:
+            y (int): The parent that just lost a child.
+        """
+        z = self.parent[y]
+        while z != NIL:
+            if not self.mark[y]:
+                self.mark[y] = 1
+                return
+            self.cut(y, z)
+            y = z
+            z = self.parent[y]
+
+
+    def delete(self, h):
+        """
+        Removes entry h from the heap.
+
+        Args:
+            h (int): The handle of the entry.
+
+        Raises:
+            ValueError: If h is not a live handle.
+
+        Returns:
+            tuple: The (key, priority) of the removed entry.
+        """
+        if h < 0 or h >= len(self.keys) or self.degree[h] < 0:
+            raise ValueError(f"Handle {h} is not in the heap.")
+        original = self.priority[h]
+        y = self.parent[h]
+        if y != NIL:
+            self.cut(h, y)
+            self.cascadingCut(y)
+        self.mMinimum = h
+        key, _ = self.extractMin()
+        return key, original
+
+
+    def fib_Union(self, other):
+        """
+        Moves every entry of other into this heap.
+
+        The arrays of other are appended to this heap's arrays, so its handles are
+        shifted: a handle h of other is h + offset in this heap. other is left empty.
+
+        Args:
+            other (ArrayFibHeap): The heap to merge into this one.
+
+        Raises:
+            ValueError: If only one heap interns keys, or the heaps share an interned
+                key. Neither heap is modified.
+
+        Returns:
+            int: The offset added to other's handles.
+        """
+        if (self.ids is None) != (other.ids is None):
+            raise ValueError("Cannot union a heap with interned keys and one without.")
+        offset = len(self.keys)
+        if self.ids is not None:
+            for key in other.ids:
+                if key in self.ids:
+                    raise ValueError(f"Duplicate key '{key}' found during union.")
+            self.ids.update((key, h + offset) for key, h in other.ids.items())
+        for name in ("parent", "child", "left", "right"):
+            shifted = array("q", (h + offset if h != NIL else NIL for h in getattr(other, name)))
+            getattr(self, name).extend(shifted)
+        self.degree.extend(other.degree)
+        self.mark.extend(other.mark)
+        self.priority.extend(other.priority)
+        self.keys.extend(other.keys)
+        self.free.extend(h + offset for h in other.free)
+
+        if other.mMinimum != NIL:
+            m = other.mMinimum + offset
+            if self.mMinimum == NIL:
+                self.mMinimum = m
+            else:
+                self.splice(self.mMinimum, m)
+                if self.priority[m] < self.priority[self.mMinimum]:
+                    self.mMinimum = m
+        self.node_count += other.node_count
+        other.__init__(other.ids is not None)
+        return offset
+
+
+    def snapshot(self):
+        """
+        Copies the whole heap state.
+
+        Returns:
+            dict: Independent copies of every array plus the minimum and node count.
+        """
+        return {
+            "parent": array("q", self.parent),
+            "child": array("q", self.child),
+            "left": array("q", self.left),
+            "right": array("q", self.right),
+            "degree": array("h", self.degree),
+            "mark": bytearray(self.mark),
+            "priority": array("d", self.priority),
+            "keys": list(self.keys),
+            "free": list(self.free),
+            "ids": None if self.ids is None else dict(self.ids),
+            "mMinimum": self.mMinimum,
+            "node_count": self.node_count,
+        }
+
+
+    @classmethod
+    def restore(cls, snapshot):
+        """
+        Builds a heap from a snapshot taken with snapshot().
+
+        Args:
+            snapshot (dict): The state returned by snapshot().
+
+        Returns:
+            ArrayFibHeap: A heap with the same forest, handles and minimum.
+        """
+        heap = cls()
+        for name, value in snapshot.items():
+            setattr(heap, name, copy.copy(value))
+        return heap
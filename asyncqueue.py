@@ -0,0 +1,210 @@
+import asyncio
+from collections import deque
+
+from fibonacciHeap import FibHeap
+
+
+class AsyncFibQueue:
+    """
+        An asyncio priority queue on top of FibHeap whose entries can be reprioritized
+        while they wait.
+
+        It follows asyncio.Queue: put waits while the queue is full, get waits while it
+        is empty, and the *_nowait variants raise asyncio.QueueFull / asyncio.QueueEmpty
+        instead. Waiters are woken one at a time in FIFO order. A waiter that is cancelled
+        after being woken passes its wake-up on, so no item or free slot is lost.
+
+        Items are (key, priority) pairs with unique keys; the smallest priority is
+        returned first. reprioritize changes a queued key's priority in place, with
+        fib_decrease for decreases, so no polling or re-insertion is needed.
+
+        The queue is not thread-safe; use it from one event loop.
+
+        Attributes:
+            heap (FibHeap): The entries.
+            maxsize (int): The maximum number of entries; 0 or less means unbounded.
+            getters (deque): Futures of coroutines waiting in get.
+            putters (deque): Futures of coroutines waiting in put.
+    """
+
+    def __init__(self, maxsize=0, metrics=None):
+        self.heap = FibHeap(metrics=metrics)
+        self.maxsize = maxsize
+        self.getters = deque()
+        self.putters = deque()
+
+
+    def qsize(self):
+        return self.heap.node_count
+
+
+    def empty(self):
+        return self.heap.isEmpty()
+
+
+    def full(self):
+        return 0 < self.maxsize <= self.heap.node_count
+
+
+    def __contains__(self, key):
+        return key in self.heap
+
+
+    def wakeup_next(self, waiters):
+        """
+        Wakes the first waiter in waiters that is still waiting.
+        """
+        while waiters:
+            waiter = waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)
+                break
+
+
+    async def wait(self, waiters, blocked):
+        """
+        Parks the calling coroutine in waiters until blocked() is False.
+
+        If the coroutine is cancelled after it was woken, the wake-up is handed to the
+        next waiter before the cancellation propagates.
+        """
+        loop = asyncio.get_running_loop()
+        while blocked():
+            waiter = loop.create_future()
+            waiters.append(waiter)
+            try:
+                await waiter
+            except BaseException:
+                waiter.cancel()
+                try:
+                    waiters.remove(waiter)
+                except ValueError:
+                    pass
+                if not waiter.cancelled():
+                    self.pass_on(waiters, blocked)
+                raise
+
+
+    def pass_on(self, waiters, blocked):
+        """
+        Hands an unused wake-up to the next waiter, if blocked() is False.
+
+        A coroutine that was woken but fails before taking its item or slot calls
+        this, so the waiters behind it are not left parked.
+        """
+        if not blocked():
+            self.wakeup_next(waiters)
+
+
+    async def put(self, key, priority):
+        """
+        Adds key with priority, waiting while the queue is full.
+
+        The key and priority are checked before waiting. If the insert still fails
+        once the coroutine is woken (the key was queued meanwhile), the free slot is
+        passed on to the next putter.
+
+        Raises:
+            ValueError: If the key is invalid or already queued, or the priority is invalid.
+        """
+        self.heap.checkKey(key)
+        if key in self.heap:
+            raise ValueError(f"Duplicate key '{key}' is not allowed.")
+        priority = self.heap.checkPriority(priority)
+        await self.wait(self.putters, self.full)
+        try:
+            self.put_nowait(key, priority)
+        except BaseException:
+            self.pass_on(self.putters, self.full)
+            raise
+
+
+    def put_nowait(self, key, priority):
+        """
+        Adds key with priority without waiting.
+
+        Raises:
+            asyncio.QueueFull: If the queue is full.
+            ValueError: If the key is invalid or already queued, or the priority is invalid.
+        """
+        if self.full():
+            raise asyncio.QueueFull
+        self.heap.insert(key, priority)
+        self.wakeup_next(self.getters)
+
+
+    async def get(self):
+        """
+        Removes the entry with the smallest priority, waiting while the queue is empty.
+
+        Returns:
+            tuple: The (key, priority) pair.
+        """
+        await self.wait(self.getters, self.empty)
+        try:
+            return self.get_nowait()
+        except BaseException:
+            self.pass_on(self.getters, self.empty)
+            raise
+
+
+    def get_nowait(self):
+        """
+        Removes the entry with the smallest priority without waiting.
+
+        Raises:
+            asyncio.QueueEmpty: If the queue is empty.
+
+        Returns:
+            tuple: The (key, priority) pair.
+        """
+        if self.empty():
+            raise asyncio.QueueEmpty
+        node = self.heap.extractMin()
+        self.wakeup_next(self.putters)
+        return node.key, node.priority
+
+
+    async def get_batch(self, n):
+        """
+        Waits for at least one entry, then removes up to n of the smallest at once.
+
+        The batch is taken with FibHeap.pop_many, so it costs one consolidation instead
+        of n.
+
+        Args:
+            n (int): The maximum batch size.
+
+        Raises:
+            ValueError: If n is smaller than 1.
+
+        Returns:
+            list: (key, priority) pairs in ascending priority order.
+        """
+        if n < 1:
+            raise ValueError(f"Batch size must be at least 1, got {n}.")
+        await self.wait(self.getters, self.empty)
+        try:
+            batch = [(node.key, node.priority) for node in self.heap.pop_many(n)]
+        except BaseException:
+            self.pass_on(self.getters, self.empty)
+            raise
+        for _ in batch:
+            self.wakeup_next(self.putters)
+        if not self.empty():
+            self.wakeup_next(self.getters)
+        return batch
+
+
+    def reprioritize(self, key, priority):
+        """
+        Changes the priority of a queued key.
+
+        This is FibHeap.update restricted to queued keys: a lower priority goes through
+        fib_decrease in O(1) amortized, a higher one re-roots the same node.
+
+        Raises:
+            ValueError: If the key is not queued or the priority is invalid.
+        """
+        self.heap.lookup(key)
+        self.heap.update(key, priority)
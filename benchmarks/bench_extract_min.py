@@ -0,0 +1,54 @@
+"""
+Extract-min throughput benchmark for FibHeap.
+
+Fills a heap with random priorities, then times draining it with extractMin, so
+nearly all of the measured time is spent in remove_min and consolidate.
+
+Usage:
+    python benchmarks/bench_extract_min.py [--sizes 10000 100000] [--repeat 3]
+"""
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from fibonacciHeap import FibHeap
+
+
+def drain(n, seed):
+    """
+    Time extracting every entry from an n-entry heap.
+
+    Args:
+        n (int): The number of entries.
+        seed (int): The random seed for the priorities.
+
+    Returns:
+        float: The elapsed drain time in seconds.
+    """
+    rng = random.Random(seed)
+    heap = FibHeap()
+    for key in range(n):
+        heap.insert(key, rng.random())
+    started = time.perf_counter()
+    while not heap.isEmpty():
+        heap.extractMin()
+    return time.perf_counter() - started
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 100_000])
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args(argv)
+
+    for n in args.sizes:
+        best = min(drain(n, seed) for seed in range(args.repeat))
+        print(f"n={n:>9}  extract-min: {n / best:>12,.0f} ops/s  ({best:.3f}s)")
+
+
+if __name__ == "__main__":
+    main()
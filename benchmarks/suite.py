@@ -0,0 +1,351 @@
+"""
+Reproducible benchmark suite comparing FibHeap with other priority queues.
+
+Every backend (FibHeap, ArrayFibHeap, heapq with lazy invalidation and the
+backends of priorityqueue.py) runs the same seeded workloads at each size. The
+suite reports operations per second, peak traced memory and a log-log scaling
+exponent per (backend, workload) as JSON, so results can be diffed between commits.
+
+Workloads:
+    insert    n inserts into an empty heap
+    extract   n extract-min calls on an n-entry heap
+    decrease  n decrease-key calls on an n-entry heap, with an extract every 10th call
+    union     merge n/100 heaps of 100 entries into one
+    dijkstra  single-source shortest paths on a random graph with n vertices and 4n edges
+
+Usage:
+    python benchmarks/suite.py --sizes 1000 10000 100000 --output results.json
+    python benchmarks/suite.py --backends fibheap heapq --workloads dijkstra --no-memory
+"""
+import argparse
+import json
+import math
+import os
+import platform
+import random
+import sys
+import time
+import tracemalloc
+from heapq import heapify, heappop, heappush
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from arrayheap import ArrayFibHeap
+from fibonacciHeap import FibHeap
+from priorityqueue import backend_class
+
+
+class FibHeapBackend:
+    """The object-graph FibHeap; handles are Node objects."""
+    name = "fibheap"
+
+    def __init__(self):
+        self.heap = FibHeap()
+
+    def push(self, key, priority):
+        return self.heap.insert(key, priority)
+
+    def pop(self):
+        node = self.heap.extractMin()
+        return node.key, node.priority
+
+    def decrease(self, handle, priority):
+        self.heap.fib_decrease(handle, priority)
+
+    def merge(self, other):
+        self.heap = self.heap.fib_Union(other.heap)
+
+    def __bool__(self):
+        return not self.heap.isEmpty()
+
+
+class ArrayFibHeapBackend:
+    """The struct-of-arrays ArrayFibHeap; handles are ints."""
+    name = "arrayfibheap"
+
+    def __init__(self):
+        self.heap = ArrayFibHeap()
+
+    def push(self, key, priority):
+        return self.heap.insert(key, priority)
+
+    def pop(self):
+        return self.heap.extractMin()
+
+    def decrease(self, handle, priority):
+        self.heap.fib_decrease(handle, priority)
+
+    def merge(self, other):
+        self.heap.fib_Union(other.heap)
+
+    def __bool__(self):
+        return not self.heap.isEmpty()
+
+
+class HeapqBackend:
+    """
+    A heapq binary heap with lazy invalidation: decrease-key pushes a fresh entry and
+    flags the old one as stale, and pop skips stale entries.
+    """
+    name = "heapq"
+
+    def __init__(self):
+        self.entries = []
+        self.live = 0
+
+    def push(self, key, priority):
+        entry = [priority, key, True]
+        heappush(self.entries, entry)
+        self.live += 1
+        return entry
+
+    def pop(self):
+        entries = self.entries
+        while True:
+            priority, key, valid = heappop(entries)
+            if valid:
+                self.live -= 1
+                return key, priority
+
+    def decrease(self, handle, priority):
+        if priority >= handle[0]:
+            return handle
+        handle[2] = False
+        entry = [priority, handle[1], True]
+        heappush(self.entries, entry)
+        return entry
+
+    def merge(self, other):
+        self.entries.extend(other.entries)
+        heapify(self.entries)
+        self.live += other.live
+        other.entries, other.live = [], 0
+
+    def __bool__(self):
+        return self.live > 0
+
+
+def queue_backend(name):
+    """
+    Builds an adapter class for a MergeablePriorityQueue backend of priorityqueue.py.
+    """
+    queue_class = backend_class(name)
+
+    class QueueBackend(FibHeapBackend):
+        def __init__(self):
+            self.heap = queue_class()
+
+    QueueBackend.name = name
+    return QueueBackend
+
+
+BACKENDS = {backend.name: backend for backend in (
+    FibHeapBackend, ArrayFibHeapBackend, HeapqBackend,
+    queue_backend("pairing"), queue_backend("binary"), queue_backend("rankpairing"),
+)}
+
+
+def run_insert(backend, n, rng):
+    priorities = [rng.random() for _ in range(n)]
+    heap = backend()
+    started = time.perf_counter()
+    for key, priority in enumerate(priorities):
+        heap.push(key, priority)
+    return n, time.perf_counter() - started
+
+
+def run_extract(backend, n, rng):
+    heap = backend()
+    for key in range(n):
+        heap.push(key, rng.random())
+    started = time.perf_counter()
+    for _ in range(n):
+        heap.pop()
+    return n, time.perf_counter() - started
+
+
+def run_decrease(backend, n, rng):
+    heap = backend()
+    handles = {key: heap.push(key, 1.0 + rng.random()) for key in range(n)}
+    current = {key: 1.0 for key in handles}
+    picks = [rng.randrange(n) for _ in range(n)]
+    ops = 0
+    started = time.perf_counter()
+    for step, key in enumerate(picks):
+        if key not in handles:
+            continue
+        current[key] -= rng.random()
+        handle = heap.decrease(handles[key], current[key])
+        if handle is not None:
+            handles[key] = handle
+        ops += 1
+        if step % 10 == 9:
+            popped, _ = heap.pop()
+            del handles[popped]
+            ops += 1
+    return ops, time.perf_counter() - started
+
+
+def run_union(backend, n, rng):
+    parts = []
+    for part in range(max(1, n // 100)):
+        heap = backend()
+        for offset in range(100):
+            heap.push(part * 100 + offset, rng.random())
+        parts.append(heap)
+    started = time.perf_counter()
+    merged = parts[0]
+    for heap in parts[1:]:
+        merged.merge(heap)
+    return len(parts) - 1, time.perf_counter() - started
+
+
+def random_graph(n, rng):
+    adjacency = [[] for _ in range(n)]
+    for u in range(n):
+        adjacency[u].append(((u + 1) % n, rng.random()))
+    for _ in range(3 * n):
+        adjacency[rng.randrange(n)].append((rng.randrange(n), rng.random()))
+    return adjacency
+
+
+def run_dijkstra(backend, n, rng):
+    adjacency = random_graph(n, rng)
+    dist = [math.inf] * n
+    handles = {}
+    heap = backend()
+    ops = 0
+    started = time.perf_counter()
+    dist[0] = 0.0
+    handles[0] = heap.push(0, 0.0)
+    while heap:
+        u, d = heap.pop()
+        del handles[u]
+        ops += 1
+        for v, weight in adjacency[u]:
+            candidate = d + weight
+            if candidate < dist[v]:
+                dist[v] = candidate
+                handle = handles.get(v)
+                if handle is None:
+                    handles[v] = heap.push(v, candidate)
+                else:
+                    replaced = heap.decrease(handle, candidate)
+                    if replaced is not None:
+                        handles[v] = replaced
+                ops += 1
+    return ops, time.perf_counter() - started
+
+
+WORKLOADS = {
+    "insert": run_insert,
+    "extract": run_extract,
+    "decrease": run_decrease,
+    "union": run_union,
+    "dijkstra": run_dijkstra,
+}
+
+
+def measure(backend, workload, n, seed, repeat, memory):
+    """
+    Run one (backend, workload, size) cell.
+
+    Timing runs are made without tracemalloc; the optional memory run is separate
+    because tracing slows the interpreter down.
+
+    Returns:
+        dict: One result record.
+    """
+    run = WORKLOADS[workload]
+    best = None
+    for attempt in range(repeat):
+        ops, elapsed = run(backend, n, random.Random(seed + attempt))
+        if best is None or elapsed < best[1]:
+            best = (ops, elapsed)
+    ops, elapsed = best
+    record = {
+        "backend": backend.name,
+        "workload": workload,
+        "n": n,
+        "ops": ops,
+        "seconds": elapsed,
+        "ops_per_sec": ops / elapsed if elapsed > 0 else None,
+        "peak_bytes": None,
+    }
+    if memory:
+        tracemalloc.start()
+        run(backend, n, random.Random(seed))
+        record["peak_bytes"] = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+    return record
+
+
+def scaling(results):
+    """
+    Fit seconds ~ n**k per (backend, workload) by least squares on log-log values.
+
+    Returns:
+        list: One {"backend", "workload", "exponent"} record per series.
+    """
+    series = {}
+    for record in results:
+        if record["seconds"] > 0:
+            series.setdefault((record["backend"], record["workload"]), []).append(
+                (math.log(record["n"]), math.log(record["seconds"])))
+    curves = []
+    for (backend, workload), points in sorted(series.items()):
+        if len(points) < 2:
+            continue
+        mean_x = sum(x for x, _ in points) / len(points)
+        mean_y = sum(y for _, y in points) / len(points)
+        spread = sum((x - mean_x) ** 2 for x, _ in points)
+        slope = sum((x - mean_x) * (y - mean_y) for x, y in points) / spread if spread else None
+        curves.append({"backend": backend, "workload": workload, "exponent": slope})
+    return curves
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1_000, 10_000, 100_000],
+                        help="heap sizes to run (the suite accepts up to 10_000_000)")
+    parser.add_argument("--backends", nargs="+", choices=sorted(BACKENDS), default=sorted(BACKENDS))
+    parser.add_argument("--workloads", nargs="+", choices=list(WORKLOADS), default=list(WORKLOADS))
+    parser.add_argument("--repeat", type=int, default=3, help="timing runs per cell; the best is kept")
+    parser.add_argument("--seed", type=int, default=12345)
+    parser.add_argument("--no-memory", dest="memory", action="store_false",
+                        help="skip the tracemalloc peak-memory run")
+    parser.add_argument("--output", help="write the JSON report here instead of stdout")
+    args = parser.parse_args(argv)
+
+    results = []
+    for workload in args.workloads:
+        for n in args.sizes:
+            for name in args.backends:
+                record = measure(BACKENDS[name], workload, n, args.seed, args.repeat, args.memory)
+                results.append(record)
+                peak = f"{record['peak_bytes'] / 2**20:8.1f} MiB" if record["peak_bytes"] is not None else ""
+                print(f"{workload:>9} n={n:<9} {name:>13}: {record['ops_per_sec']:>12,.0f} ops/s {peak}",
+                      file=sys.stderr)
+
+    report = {
+        "meta": {
+            "python": platform.python_version(),
+            "implementation": platform.python_implementation(),
+            "machine": platform.machine(),
+            "seed": args.seed,
+            "repeat": args.repeat,
+            "sizes": args.sizes,
+        },
+        "results": results,
+        "scaling": scaling(results),
+    }
+    text = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w") as handle:
+            handle.write(text + "\n")
+    else:
+        print(text)
+
+
+if __name__ == "__main__":
+    main()
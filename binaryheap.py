@@ -0,0 +1,201 @@
+from fibonacciHeap import FibHeap
+from priorityqueue import MergeablePriorityQueue
+
+
+class HeapEntry:
+    """
+        An indexed binary-heap entry.
+
+        Attributes:
+            key: The unique identifier of the entry.
+            priority: The priority value used for ordering.
+            position: The entry's current slot in the heap array.
+    """
+    __slots__ = ("key", "priority", "position")
+
+    def __init__(self, key, priority, position):
+        self.key = key
+        self.priority = priority
+        self.position = position
+
+    def __str__(self) -> str:
+        return f"Key: {self.key}, Priority: {self.priority}"
+
+
+class IndexedBinaryHeap(MergeablePriorityQueue):
+    """
+        An array-based binary min-heap whose entries know their own position.
+
+        insert, extractMin, fib_decrease and delete are O(log n) worst case with very
+        small constants. fib_Union appends the other array and re-heapifies, which is
+        O(n + m), so this backend suits workloads where unions are rare.
+
+        Attributes:
+            heap (list): The entries in heap order.
+            index (dict): Maps every key to its entry.
+    """
+    handle_type = HeapEntry
+    checkKey = FibHeap.checkKey
+    checkPriority = FibHeap.checkPriority
+
+    def __init__(self):
+        self.heap = []
+        self.index = {}
+
+
+    @property
+    def node_count(self):
+        return len(self.heap)
+
+
+    def insert(self, key, priority):
+        """
+        Inserts key with priority.
+
+        Raises:
+            ValueError: If the key is invalid or already present, or the priority is invalid.
+
+        Returns:
+            HeapEntry: The new entry.
+        """
+        self.checkKey(key)
+        if key in self.index:
+            raise ValueError(f"Duplicate key '{key}' is not allowed.")
+        entry = HeapEntry(key, self.checkPriority(priority), len(self.heap))
+        self.heap.append(entry)
+        self.index[key] = entry
+        self.sift_up(entry.position)
+        return entry
+
+
+    def sift_up(self, position):
+        """
+        Moves the entry at position towards the root until its parent is not larger.
+        """
+        heap = self.heap
+        entry = heap[position]
+        priority = entry.priority
+        while position > 0:
+            parent = (position - 1) >> 1
+            above = heap[parent]
+            if above.priority <= priority:
+                break
+            heap[position] = above
+            above.position = position
+            position = parent
+        heap[position] = entry
+        entry.position = position
+
+
+    def sift_down(self, position):
+        """
+        Moves the entry at position towards the leaves until no child is smaller.
+        """
+        heap = self.heap
+        size = len(heap)
+        entry = heap[position]
+        priority = entry.priority
+        while True:
+            child = 2 * position + 1
+            if child >= size:
+                break
+            right = child + 1
+            if right < size and heap[right].priority < heap[child].priority:
+                child = right
+            below = heap[child]
+            if below.priority >= priority:
+                break
+            heap[position] = below
+            below.position = position
+            position = child
+        heap[position] = entry
+        entry.position = position
+
+
+    def isEmpty(self):
+        return not self.heap
+
+
+    def getMin(self):
+        return self.heap[0] if self.heap else None
+
+
+    def remove_at(self, position):
+        """
+        Removes the entry at position by moving the last entry into its slot.
+
+        Returns:
+            HeapEntry: The removed entry.
+        """
+        heap = self.heap
+        entry = heap[position]
+        last = heap.pop()
+        if last is not entry:
+            heap[position] = last
+            last.position = position
+            if position > 0 and last.priority < heap[(position - 1) >> 1].priority:
+                self.sift_up(position)
+            else:
+                self.sift_down(position)
+        del self.index[entry.key]
+        entry.position = -1
+        return entry
+
+
+    def extractMin(self):
+        """
+        Removes the minimum entry.
+
+        Raises:
+            ValueError: If the heap is empty.
+
+        Returns:
+            HeapEntry: The removed entry.
+        """
+        if not self.heap:
+            raise ValueError("Empty Heap")
+        return self.remove_at(0)
+
+
+    def fib_decrease(self, x, priority):
+        """
+        Lowers the priority of entry x; larger priorities are ignored.
+        """
+        if priority > x.priority:
+            return
+        x.priority = priority
+        self.sift_up(x.position)
+
+
+    def delete(self, x):
+        """
+        Removes the entry x (or the entry stored under key x).
+
+        Raises:
+            ValueError: If x is not in the heap.
+
+        Returns:
+            HeapEntry: The removed entry.
+        """
+        return self.remove_at(self.lookup(x).position)
+
+
+    def fib_Union(self, other):
+        """
+        Appends other's entries and restores heap order bottom-up.
+
+        Raises:
+            ValueError: If the heaps share a key.
+
+        Returns:
+            IndexedBinaryHeap: This heap.
+        """
+        self.merge_index(other)
+        offset = len(self.heap)
+        for entry in other.heap:
+            entry.position += offset
+        self.heap.extend(other.heap)
+        other.heap = []
+        for position in range(len(self.heap) // 2 - 1, -1, -1):
+            self.sift_down(position)
+        return self
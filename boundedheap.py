@@ -0,0 +1,213 @@
+from fibonacciHeap import FibHeap
+
+
+class BoundedFibHeap:
+    """
+        A double-ended Fibonacci heap that keeps at most capacity entries: the ones with
+        the smallest priorities seen so far.
+
+        Every entry lives in two FibHeaps, one ordered by priority (the best end) and
+        one by negated priority (the worst end), so both extremes are O(1) to read.
+        When one end removes an entry, its twin at the other end is tombstoned with
+        discard in O(1) and purged in bulk by that heap's next consolidation.
+
+        offer compares an entry against the current worst in O(1) and rejects it
+        right away if it would not be kept, which is the common case once a long
+        stream has filled the heap. Accepted entries cost O(log capacity) amortized.
+        Memory stays bounded by capacity however long the stream runs.
+
+        To keep the largest scores instead, offer their negations.
+
+        Attributes:
+            capacity (int): The maximum number of entries.
+            best (FibHeap): The entries ordered by priority.
+            worst (FibHeap): The same keys ordered by negated priority.
+    """
+    OFFER_CHUNK = 256
+
+    def __init__(self, capacity, metrics=None):
+        """
+        Args:
+            capacity (int): The maximum number of entries.
+            metrics (HeapMetrics): Optional instrumentation for the best-end heap.
+
+        Raises:
+            ValueError: If capacity is smaller than 1.
+        """
+        if capacity < 1:
+            raise ValueError(f"capacity must be at least 1, got {capacity}.")
+        self.capacity = capacity
+        self.best = FibHeap(metrics)
+        self.worst = FibHeap()
+
+
+    def __len__(self):
+        return self.best.node_count
+
+
+    def __contains__(self, key):
+        return key in self.best
+
+
+    def isEmpty(self):
+        return self.best.isEmpty()
+
+
+    def getMin(self):
+        """
+        Returns:
+            tuple: The (key, priority) with the smallest priority, or None if empty.
+        """
+        node = self.best.mMinimum
+        return None if node is None else (node.key, node.priority)
+
+
+    def getMax(self):
+        """
+        Returns:
+            tuple: The (key, priority) with the largest priority (the next entry to be
+            evicted), or None if empty.
+        """
+        node = self.worst.mMinimum
+        return None if node is None else (node.key, -node.priority)
+
+
+    def offer(self, key, priority):
+        """
+        Offers an entry; it is kept if the heap has room or it beats the worst entry.
+
+        A key that is already kept is moved to the new priority only if that is lower.
+
+        Raises:
+            ValueError: If the key or the priority is invalid.
+
+        Returns:
+            tuple: The (key, priority) that did not make it, either the evicted worst
+            entry or the offered one; None if nothing was dropped.
+        """
+        self.best.checkKey(key)
+        return self.admit(key, self.best.checkPriority(priority))
+
+
+    def admit(self, key, priority):
+        """
+        The body of offer, for a key and a float priority that are already validated.
+        """
+        node = self.best.get_node(key)
+        if node is not None:
+            if priority >= node.priority:
+                return key, priority
+            self.best.fib_decrease(node, priority)
+            # the twin moves away from the worst end, i.e. its negation increases
+            self.worst.update(key, -priority)
+            return None
+
+        worst = self.worst.mMinimum
+        if self.best.node_count < self.capacity:
+            evicted = None
+        elif priority >= -worst.priority:
+            return key, priority
+        else:
+            evicted = self.extractMax()
+
+        self.best.insert(key, priority)
+        self.worst.insert(key, -priority)
+        return evicted
+
+
+    def offer_many(self, items):
+        """
+        Offers a batch of (key, priority) pairs.
+
+        The batch is validated in one pass. It is then admitted in chunks of
+        OFFER_CHUNK entries: once the heap is full, each chunk is first filtered
+        against the current worst priority in one comprehension, so entries that
+        cannot be kept are dropped without any per-entry heap work.
+
+        Args:
+            items: An iterable of (key, priority) pairs.
+
+        Raises:
+            ValueError: If any key or priority is invalid; nothing is offered then.
+
+        Returns:
+            int: The number of offered entries that were kept.
+        """
+        items = list(items)
+        if not items:
+            return 0
+        keys = [key for key, _ in items]
+        priorities = [priority for _, priority in items]
+        try:
+            # hashing the whole batch at C speed; the single-key check reports failures
+            distinct = set(keys)
+        except TypeError:
+            distinct = ()
+            for key in keys:
+                self.best.checkKey(key)
+        if None in distinct:
+            self.best.checkKey(None)
+        priorities = self.best.checkPriorities(priorities)
+
+        kept = 0
+        for start in range(0, len(keys), self.OFFER_CHUNK):
+            pairs = zip(keys[start:start + self.OFFER_CHUNK], priorities[start:start + self.OFFER_CHUNK])
+            if self.best.node_count >= self.capacity:
+                threshold = -self.worst.mMinimum.priority
+                pairs = [(key, priority) for key, priority in pairs if priority < threshold]
+            for key, priority in pairs:
+                if self.admit(key, priority) != (key, priority):
+                    kept += 1
+        return kept
+
+
+    def extractMin(self):
+        """
+        Removes the entry with the smallest priority.
+
+        Raises:
+            ValueError: If the heap is empty.
+
+        Returns:
+            tuple: The removed (key, priority).
+        """
+        node = self.best.extractMin()
+        self.worst.discard(node.key)
+        return node.key, node.priority
+
+
+    def extractMax(self):
+        """
+        Removes the entry with the largest priority.
+
+        Raises:
+            ValueError: If the heap is empty.
+
+        Returns:
+            tuple: The removed (key, priority).
+        """
+        node = self.worst.extractMin()
+        self.best.discard(node.key)
+        return node.key, -node.priority
+
+
+    def discard(self, key):
+        """
+        Removes key if it is kept.
+
+        Returns:
+            bool: True if the key was removed.
+        """
+        if not self.best.discard(key):
+            return False
+        self.worst.discard(key)
+        return True
+
+
+    def iter_sorted(self):
+        """
+        Lazily yields the kept (key, priority) pairs, smallest priority first, without
+        modifying the heap.
+        """
+        for node in self.best.iter_sorted():
+            yield node.key, node.priority
@@ -0,0 +1,272 @@
+import struct
+from itertools import count
+from operator import index
+
+from fibonacciHeap import FibHeap
+
+DOUBLE = struct.Struct("<d")
+SIGN_BIT = 1 << 63
+LOW_64 = (1 << 64) - 1
+
+
+class PriorityPacker:
+    """
+        Packs composite priorities, such as (cost, deadline), into one int whose
+        natural order is the lexicographic order of the components.
+
+        Each component gets a fixed-width bit field, the first component in the most
+        significant bits. A float component takes 64 bits: its IEEE 754 bits are
+        mapped so that unsigned order equals float order (the sign bit is flipped for
+        positive values, every bit for negative ones). An int component takes the given
+        number of bits and must be non-negative. With fifo, an insertion sequence number
+        fills the lowest bits, so equal priorities come out first in, first out.
+
+        A heap then compares two ints where it would have compared two tuples, which
+        keeps every comparison a single primitive compare.
+
+        Attributes:
+            fields (tuple): float or an int bit width, per component.
+            fifo (bool): Whether a sequence number breaks ties.
+            sequence_bits (int): The width of the sequence number.
+            total_bits (int): The width of a packed priority.
+            sequence (count): The source of sequence numbers.
+    """
+
+    def __init__(self, fields, fifo=False, sequence_bits=48):
+        """
+        Args:
+            fields: float or a positive int bit width, per component.
+            fifo (bool): Break ties between equal priorities by insertion order.
+            sequence_bits (int): The width of the sequence number, i.e. the log2 of the
+                number of packs it can order.
+
+        Raises:
+            ValueError: If there are no fields or a field is neither float nor a
+                positive bit width.
+        """
+        fields = tuple(fields)
+        if not fields:
+            raise ValueError("a composite priority needs at least one field.")
+        for field in fields:
+            if field is not float and (not isinstance(field, int) or field < 1):
+                raise ValueError(f"invalid field {field!r}: use float or a positive bit width.")
+        self.fields = fields
+        self.fifo = fifo
+        self.sequence_bits = sequence_bits if fifo else 0
+        self.total_bits = sum(64 if field is float else field for field in fields) + self.sequence_bits
+        self.sequence = count()
+
+
+    @property
+    def layout(self):
+        """
+        The fields, fifo flag and sequence width; packers with equal layouts produce
+        comparable priorities.
+        """
+        return self.fields, self.fifo, self.sequence_bits
+
+
+    def pack(self, values):
+        """
+        Packs one composite priority.
+
+        Args:
+            values: One value per field.
+
+        Raises:
+            ValueError: If the number of values does not match the fields, a value is
+                None, NaN or out of its field's range, or the sequence is exhausted.
+
+        Returns:
+            int: The packed priority.
+        """
+        if values is None:
+            raise ValueError("priority cannot be None")
+        try:
+            values = tuple(values)
+        except TypeError:
+            raise ValueError(f"invalid priority value: {values}; expected {len(self.fields)} fields.")
+        if len(values) != len(self.fields):
+            raise ValueError(f"invalid priority value: {values}; expected {len(self.fields)} fields.")
+
+        packed = 0
+        for field, value in zip(self.fields, values):
+            if field is float:
+                try:
+                    value = float(value) + 0.0  # also folds -0.0 into 0.0
+                except (TypeError, ValueError):
+                    raise ValueError(f"invalid priority value: {value}")
+                if value != value:
+                    raise ValueError(f"{value} is invalid: cannot be NaN.")
+                bits = int.from_bytes(DOUBLE.pack(value), "little")
+                packed = packed << 64 | (bits ^ LOW_64 if bits & SIGN_BIT else bits | SIGN_BIT)
+            else:
+                try:
+                    value = index(value)
+                except TypeError:
+                    raise ValueError(f"invalid priority value: {value}; expected an int.")
+                if not 0 <= value < 1 << field:
+                    raise ValueError(f"{value} does not fit in an unsigned {field}-bit field.")
+                packed = packed << field | value
+
+        if self.fifo:
+            sequence = next(self.sequence)
+            if sequence >> self.sequence_bits:
+                raise ValueError(f"the {self.sequence_bits}-bit FIFO sequence is exhausted.")
+            packed = packed << self.sequence_bits | sequence
+        return packed
+
+
+    def unpack(self, packed):
+        """
+        Returns:
+            tuple: The components of a packed priority, without the sequence number.
+        """
+        packed >>= self.sequence_bits
+        values = []
+        for field in reversed(self.fields):
+            if field is float:
+                bits = packed & LOW_64
+                bits = bits ^ SIGN_BIT if bits & SIGN_BIT else bits ^ LOW_64
+                values.append(DOUBLE.unpack(bits.to_bytes(8, "little"))[0])
+                packed >>= 64
+            else:
+                values.append(packed & ((1 << field) - 1))
+                packed >>= field
+        values.reverse()
+        return tuple(values)
+
+
+class CompositeFibHeap(FibHeap):
+    """
+        A FibHeap whose priorities are composite values packed by a PriorityPacker.
+
+        Every entry point that takes a priority (insert, insert_many, fib_decrease,
+        decrease_key, update) takes a sequence with one value per field and packs it
+        once; the forest then only ever compares ints. A bare number is rejected, as it
+        cannot be told apart from a packed priority. decrease_checked is the one entry
+        point for a priority that is already packed.
+
+        node.priority holds the packed int; priority_of and unpack return the
+        components. With a FIFO packer, a decrease or update takes a new sequence
+        number, so the entry queues behind equal priorities set before it.
+
+        Snapshots store priorities as doubles, so save and load are not supported.
+
+        Attributes:
+            packer (PriorityPacker): Packs and unpacks the priorities.
+    """
+
+    def __init__(self, packer, metrics=None, registry=None, debug=False, pool=None):
+        """
+        Args:
+            packer (PriorityPacker): Packs and unpacks the priorities.
+            metrics (HeapMetrics): Optional instrumentation.
+            registry (KeyRegistry): Optional key registry shared with sibling heaps.
+            debug (bool): Run check_invariants after every public operation.
+            pool (NodePool): Optional free list for nodes.
+        """
+        super().__init__(metrics, registry, debug, pool)
+        self.packer = packer
+
+
+    @classmethod
+    def from_items(cls, items, packer, metrics=None):
+        """
+        Builds a heap from (key, composite priority) pairs with a single insert_many.
+
+        Returns:
+            CompositeFibHeap: The new heap.
+        """
+        heap = cls(packer, metrics)
+        heap.insert_many(items)
+        return heap
+
+
+    def checkPriority(self, priority):
+        """
+        Packs a composite priority.
+
+        Raises:
+            ValueError: If the priority is not a sequence of field values or cannot be
+                packed.
+
+        Returns:
+            int: The packed priority.
+        """
+        return self.packer.pack(priority)
+
+
+    def checkPriorities(self, priorities):
+        """
+        Packs a batch of composite priorities in input order.
+
+        Raises:
+            ValueError: If any priority cannot be packed.
+
+        Returns:
+            list: The packed priorities.
+        """
+        return list(map(self.packer.pack, priorities))
+
+
+    def fib_decrease(self, x, priority):
+        """
+        FibHeap.fib_decrease for a composite priority.
+        """
+        self.decrease_checked(x, self.checkPriority(priority))
+
+
+    def decrease_checked(self, x, packed):
+        """
+        FibHeap.fib_decrease for a priority that is already packed by this heap's
+        packer, such as another node's priority attribute. decrease_key and update
+        pack once and come through here.
+        """
+        super().fib_decrease(x, packed)
+
+
+    def fib_Union(self, other):
+        """
+        FibHeap.fib_Union for two heaps with the same packer layout.
+
+        With fifo, the heaps must share the packer itself: sequence numbers from two
+        packers interleave, which would break first in, first out across the merge.
+
+        Raises:
+            ValueError: If other is not a CompositeFibHeap with the same layout, or with
+                fifo, does not share this heap's packer.
+        """
+        if not isinstance(other, CompositeFibHeap) or other.packer.layout != self.packer.layout:
+            raise ValueError("Cannot merge heaps whose priorities are packed differently.")
+        if self.packer.fifo and other.packer is not self.packer:
+            raise ValueError("Cannot merge FIFO heaps that take sequence numbers from different packers.")
+        return super().fib_Union(other)
+
+
+    def priority_of(self, key):
+        """
+        Returns:
+            tuple: The components of the priority stored under key.
+
+        Raises:
+            ValueError: If the key is not in the heap.
+        """
+        return self.packer.unpack(self.lookup(key).priority)
+
+
+    def unpack(self, priority):
+        """
+        Returns:
+            tuple: The components of a packed priority, e.g. node.priority.
+        """
+        return self.packer.unpack(priority)
+
+
+    def save(self, path):
+        raise ValueError("Snapshots store priorities as doubles; packed priorities do not fit.")
+
+
+    @classmethod
+    def load(cls, path, metrics=None):
+        raise ValueError("Snapshots store priorities as doubles; packed priorities do not fit.")
@@ -1,11 +1,32 @@
+import gc
+import heapq
 import math
-from collections import defaultdict
+import mmap
+import operator
+import os
+import pickle
+import struct
+import sys
+from array import array
+from itertools import count, islice
 from math import inf as infinity
+from time import perf_counter
 from nodes import Node
 from fibtree import Fibtree
+from registry import OwnerToken
+from priorityqueue import MergeablePriorityQueue
 
+# log base phi of n bounds the degree of any node in an n-node Fibonacci heap
+LOG_PHI = math.log((1 + math.sqrt(5)) / 2)
 
-class FibHeap:
+# save/load file layout: magic, format version, little-endian flag, node count,
+# preorder position of the minimum, and the byte offset of the pickled keys
+SNAPSHOT_HEADER = struct.Struct("=4sBB2xqqq")
+SNAPSHOT_MAGIC = b"FIBH"
+SNAPSHOT_VERSION = 1
+
+
+class FibHeap(MergeablePriorityQueue):
     """
      A class representing a Fibonacci heap data structure.
 
@@ -17,14 +38,50 @@ class FibHeap:
         mMinimum (Node): The minimum node in the Fibonacci heap.
         rootlist (Fibtree): The root list containing trees of the heap.
         node_count (int): The total number of nodes in the heap.
-        key_set(set): stores unique keys to avoid duplication
+        index (dict): Maps every key in the heap to its Node, so keys stay unique and
+            can be looked up in O(1).
+        degree_table (list): Scratch table reused by consolidate, indexed by degree.
+        metrics (HeapMetrics): Optional instrumentation; None keeps the heap silent and uninstrumented.
+        registry (KeyRegistry): The key registry shared with sibling heaps, or None when
+            the heap owns its index.
+        token (OwnerToken): Marks the nodes owned by this heap when a registry is shared.
+        graveyard (list): Nodes removed with discard that are still linked into the
+            forest; purge unlinks them in bulk.
+        debug (bool): When True, every public operation ends with check_invariants.
+        pool (NodePool): Optional free list for nodes: purged tombstones and nodes handed
+            back with release are reused; None allocates a new Node for every insert.
     """
-    def __init__(self):
+    handle_type = Node
+
+    def __init__(self, metrics=None, registry=None, debug=False, pool=None):
         # Initialize the Fibonacci heap with no minimum node, an empty root list, and zero node count
         self.mMinimum = None   
         self.rootlist = Fibtree() # The root list is managed as a forest of Fibonacci trees
         self.node_count = 0
-        self.key_set = set()  # A set to store unique keys
+        self.index = {}  # key -> Node for every node in the heap
+        self.degree_table = []  # reused by consolidate, indexed by degree
+        self.metrics = metrics
+        self.registry = registry
+        self.token = None
+        if registry is not None:
+            # sibling heaps share one index; node ownership is tracked by token
+            self.index = registry.index
+            self.token = OwnerToken()
+        self.graveyard = []  # tombstoned nodes still in the forest
+        self.debug = debug
+        self.pool = pool
+
+
+    @property
+    def key_set(self):
+        """
+        A read-only view of the keys currently stored in the heap.
+
+        With a shared registry this is built by filtering the registry's index.
+        """
+        if self.token is None:
+            return self.index.keys()
+        return {key for key, node in self.index.items() if node.owner.find() is self.token}
 
 
     def insert(self, key, priority):
@@ -45,43 +102,153 @@ class FibHeap:
         Returns:
             Node: The newly created node.
         """
-        self.check(key)
+        m = self.metrics
+        if m is not None and m.latency:
+            started = perf_counter()
+
+        self.checkKey(key)
         # Check if the key is already in the heap
-        if key in self.key_set:
+        if key in self.index:
             raise ValueError(f"Duplicate key '{key}' is not allowed.")
             
         priority = self.checkPriority(priority) 
-        new_node =  Node(key,priority)
-        self.key_set.add(key)  # Add key to the set
-        
-        if self.mMinimum is None:
-            self.rootlist.add_to_root_list(new_node)   
-            self.mMinimum = new_node   
-            
-        else: 
-            self.rootlist.add_to_root_list(new_node)  
-            if new_node.priority < self.mMinimum.priority:
-                self.mMinimum = new_node  
+        new_node = Node(key, priority) if self.pool is None else self.pool.acquire(key, priority)
+        self.add_root(new_node)
 
-        self.node_count += 1
-        print(f"Inserted {key} with priority {priority}. Total nodes: {self.node_count}")
+        if m is not None:
+            m.inserts += 1
+            m.emit("insert", key=key, priority=priority, node_count=self.node_count)
+            if m.latency:
+                m.observe("insert", perf_counter() - started)
+        if self.debug:
+            self.check_invariants()
         return new_node
 
+    def insert_many(self, items):
+        """
+        Inserts a batch of (key, priority) pairs.
+
+        The batch is validated up front: priorities are converted and NaN-checked in one
+        pass, and duplicate keys (within the batch or against the heap) are detected with
+        set operations before anything is modified. The new nodes are then chained and
+        spliced into the root list in one step, and the minimum is computed once.
+
+        Args:
+            items: An iterable of (key, priority) pairs.
+
+        Raises:
+            ValueError: If any key or priority is invalid, or a key is duplicated. The heap
+                is left unchanged.
+
+        Returns:
+            list: The newly created nodes, in input order.
+        """
+        m = self.metrics
+        if m is not None and m.latency:
+            started = perf_counter()
+
+        pairs = list(items)
+        if not pairs:
+            return []
+        keys = [key for key, _ in pairs]
+        priorities = self.checkPriorities([priority for _, priority in pairs])
+
+        # duplicate keys, in the batch or already in the heap
+        try:
+            batch = dict.fromkeys(keys)
+        except TypeError:
+            for key in keys:
+                self.checkKey(key)
+        if None in batch:
+            raise ValueError("key cannot be None")
+        if len(batch) != len(keys) or not self.index.keys().isdisjoint(batch):
+            seen = set()
+            for key in keys:
+                if key in seen or key in self.index:
+                    raise ValueError(f"Duplicate key '{key}' is not allowed.")
+                seen.add(key)
+
+        nodes = list(map(Node if self.pool is None else self.pool.acquire, keys, priorities))
+        # chain the new nodes together, then splice the chain into the root list
+        for left, right in zip(nodes, nodes[1:]):
+            left.next = right
+            right.prev = left
+        self.rootlist.splice(nodes[0], nodes[-1])
+        self.index.update(zip(keys, nodes))
+        if self.token is not None:
+            for node in nodes:
+                node.owner = self.token
+
+        smallest = min(range(len(nodes)), key=priorities.__getitem__)
+        if self.mMinimum is None or priorities[smallest] < self.mMinimum.priority:
+            self.mMinimum = nodes[smallest]
+        self.node_count += len(nodes)
+
+        if m is not None:
+            m.inserts += len(nodes)
+            m.emit("insert_many", count=len(nodes), node_count=self.node_count)
+            if m.latency:
+                m.observe("insert_many", perf_counter() - started)
+        if self.debug:
+            self.check_invariants()
+        return nodes
+
+
+    @classmethod
+    def from_items(cls, items, metrics=None):
+        """
+        Builds a heap from (key, priority) pairs with a single insert_many call.
+
+        Args:
+            items: An iterable of (key, priority) pairs.
+            metrics (HeapMetrics): Optional instrumentation for the new heap.
+
+        Returns:
+            FibHeap: The new heap.
+        """
+        heap = cls(metrics)
+        heap.insert_many(items)
+        return heap
+
+
+    def add_root(self, node):
+        """
+        Adds a detached node to the root list and registers its key in the index.
+
+        Args:
+            node (Node): A node that is not part of any heap.
+        """
+        self.rootlist.add_to_root_list(node)
+        self.index[node.key] = node
+        if self.token is not None:
+            node.owner = self.token
+        if self.mMinimum is None or node.priority < self.mMinimum.priority:
+            self.mMinimum = node
+        self.node_count += 1
+
+
     def checkKey(self, key):
         """
-        Checks if the provided key is a single character.
+        Checks if the provided key can be used to index the heap.
+
+        Keys are stored in a dict, so any hashable value (characters, ints such as
+        vertex ids, tuples) is accepted.
 
         Args:
             key: The key to be validated.
 
         Raises:
-            ValueError: If the key is not a single character.
+            ValueError: If the key is None or not hashable.
     
         Returns:
             bool: True if the key is valid, otherwise raises ValueError.
          """
-        if not isinstance(key, str) or len(key) != 1:
-            raise ValueError(f"Invalid key '{key}'. Key must be a single character.")
+        if key is None:
+            raise ValueError("key cannot be None")
+        try:
+            hash(key)
+        except TypeError:
+            raise ValueError(f"Invalid key '{key}'. Key must be hashable.")
         return True  
     
          
@@ -100,28 +267,47 @@ class FibHeap:
         return priority
 
 
+    def checkPriorities(self, priorities):
+        """
+        Validates a list of priorities in one pass.
+
+        Args:
+            priorities (list): The priorities to convert.
+
+        Raises:
+            ValueError: If any priority is None, not a number or NaN.
+
+        Returns:
+            list: The priorities converted to floats.
+        """
+        try:
+            values = list(map(float, priorities))
+        except (TypeError, ValueError):
+            # let the single-item check report the offending value
+            for priority in priorities:
+                self.checkPriority(priority)
+            raise
+        # a NaN anywhere makes the sum NaN (the only float not equal to itself)
+        total = sum(values)
+        if total != total:
+            for value in values:
+                self.checkPriority(value)
+        return values
+
+
     def isEmpty(self):
         """
         Check if the Fibonacci heap is empty.
 
         Returns:
             bool: True if the heap is empty, False otherwise.
-    
-        Prints:
-            A message indicating whether the heap is empty or not.
         """
-        
-        empty = self.mMinimum is None
-        if empty:
-            print("the heap is empty")
-        else:
-            print("The heap is not empty")
-        return empty
+        return self.mMinimum is None
 
 
     def getMin(self):
-         """
-         Retrieves the minimum node from the Fibonacci heap.
+        """
+        Retrieves the minimum node from the Fibonacci heap.
             This operation checks whether the heap is empty and returns the node with the minimum
             priority.
 
@@ -133,50 +319,63 @@ class FibHeap:
         return self.mMinimum
     
    
-   def fib_Union(self, other):
+    def fib_Union(self, other):
         """
         Merges two Fibonacci heaps and returns the resulting heap.
 
+        Heaps created from the same KeyRegistry already share one index that keeps keys
+        unique, so merging them is O(1): the root lists are spliced and other's owner
+        token is pointed at this heap's token. Heaps with their own indexes have every
+        key of the smaller index checked and moved into the larger one.
+
         Args:
             other (FibHeap): The other Fibonacci heap to merge with this one.
 
+        Raises:
+            ValueError: If the heaps share a key, or only one of them uses a registry
+                (or they use different registries).
+
         Returns:
             FibHeap: The merged Fibonacci heap.
         """
-       
+        if self.registry is not other.registry:
+            raise ValueError("Cannot union heaps that do not share the same key registry.")
+
+        m = self.metrics
+        if m is not None:
+            m.unions += 1
+            m.emit("union", node_count=self.node_count, other_count=other.node_count)
+
         if self.mMinimum is None:
             return other
         
         if other.mMinimum is None:
            return self
        
-        current = other.rootlist.head
-        
-        visited = set()
-       
-        while current and current not in visited:
-            if current.key in self.key_set:
-                raise ValueError(f"Dupliace key '{current.key}' found during union.")
-            
-            self.key_set.add(current.key)
-            visited.add(current)
-            current = current.next
-            if current == other.rootlist.head:
-                break
+        if self.registry is not None:
+            # hand every node of other to this heap in one step
+            other.token.parent = self.token
+            other.token = OwnerToken()
+        else:
+            # check every key of the smaller index against the larger one, then merge
+            # the smaller into the larger so the cost is bounded by the smaller heap
+            self.merge_index(other)
                 
         #link the two list
-        self.rootlist.last.next = other.rootlist.head
-        other.rootlist.head.prev = self.rootlist.last
-        self.rootlist.last = other.rootlist.last
+        self.rootlist.splice(other.rootlist.head, other.rootlist.last)
+        self.graveyard.extend(other.graveyard)
+        other.graveyard = []
         
         if( other.mMinimum.priority < self.mMinimum.priority):
             self.mMinimum = other.mMinimum
         
         self.node_count += other.node_count
         
-        other.rootlist.head = None
+        other.rootlist.head = other.rootlist.last = None
         other.mMinimum = None
         other.node_count = 0
+        if self.debug:
+            self.check_invariants()
         
         #return the union of the two heaps
         return self
@@ -203,76 +402,55 @@ class FibHeap:
         visited.add(current)
         
      
-    def fib_Link(self, y, x):
+    def check_invariants(self):
         """
-        Links two nodes in a Fibonacci heap by making node y a child of node x.
+        Audits the whole heap in O(n); see invariants.check_invariants.
 
-        This function checks that both nodes are valid and that node y does not 
-        already have a parent. It ensures that node x has a priority less than 
-        or equal to node y's priority before linking. If the conditions are met, 
-        node y is removed from the root list and added to the child list of node x, 
-        and the degree of node x is updated accordingly.
+        Raises:
+            ValueError: Describing the first broken invariant.
+        """
+        from invariants import check_invariants
+        check_invariants(self)
 
-        Args:
-            y (Node): The node to be linked as a child.
-            x (Node): The node to be linked to (parent).
 
-        Raises:
-            ValueError: If either x or y is None.
-            ValueError: If node y already has a parent.
-            ValueError: If node y is not in the root list.
-            ValueError: If x's priority is greater than y's priority.
+    def fib_Link(self, y, x):
+        """
+        Links two roots of a Fibonacci heap by making node y a child of node x.
+
+        y is removed from the root list and added to the child list of x, and its
+        mark is cleared. The caller guarantees that both are roots and that x's
+        priority is not larger than y's; check_invariants reports a violation.
 
+        Args:
+            y (Node): The root to be linked as a child.
+            x (Node): The root to be linked to (parent).
         """
-        # Check if both x and y are present in the rootlist
-        if x is None or y is None:
-            raise ValueError("Neither x nor y can be None.")
+        self.rootlist.remove_from_root_list(y)
+        x.add_to_child_list(y)
+        y.mark = False
 
-    # Check if y already has a parent
-        if y.parent is not None:
-            raise ValueError("Node y already has a parent.")
-            
-        # add y in x child list
-        x.children.add_to_root_list(y)
-        
-    # Check if y is in the root list
-        if self.rootlist.head is None or (y.prev is None and y.next is None):
-            raise ValueError("Node y is not in the root list.")
+        m = self.metrics
+        if m is not None:
+            m.links += 1
+            m.emit("link", child=y.key, parent=x.key, degree=x.degree)
 
-    # Check if x's priority is less than or equal to y's priority
-        if x.priority <= y.priority:
-    
-         
-        # Remove y from the root list
-            self.rootlist.remove_from_root_list(y)
-        
-        # Add y to the child list of x
-            x.add_to_child_list(y)
-            y.parent = x
-        
-        # Update the degree of x
-            x.degree += 1
-        
-        # Reset the mark of y
-            y.mark = False
-        
-        # Print the successful linking
-            print(f"Added child {y.key} to parent {x.key}. New degree: {x.degree}")
-        else:
-           raise ValueError("Cannot link y as a child of x because y's priority is lower than x's priority.")
-        
 
-   
     def consolidate(self):
         """
         Consolidates the trees in the root list of the Fibonacci heap by merging
         trees of equal degree together. 
 
-        The function iterates through the root list and uses a dictionary to
-        keep track of trees by their degree. If two trees have the same degree,
-        the tree with the higher priority becomes a child of the tree with the 
-        lower priority using the helper function `fib_Link`. This process continues
-        until all trees in the root list have distinct degrees.
+        The function walks the root list once and keeps the trees seen so far in a
+        degree table, a list indexed by degree and preallocated to the log_phi(n)
+        bound on the degree of any node. If two trees have the same degree, the tree
+        with the higher priority becomes a child of the tree with the lower priority.
+        This process continues until all trees in the root list have distinct degrees.
+
+        The surviving trees are then relinked into the root list directly from the
+        table, and the new minimum is found in that same pass.
+
+        Nodes tombstoned by discard are purged first, so they never take part in
+        linking.
 
         Updates:
             - The minimum node (mMinimum) in the heap.
@@ -281,55 +459,97 @@ class FibHeap:
         Raises:
             None.
         """
-        # Dictionary to store nodes by their degree 
-        nodes = defaultdict(list)
+        # tombstoned nodes are dropped before the roots are linked
+        if self.graveyard:
+            self.purge()
 
-        # initialize variable current as the minimum node
+        # initialize variable current as the first root
         current = self.rootlist.head 
 
         # Handle the case where the heap is empty
         if current is None:
+            self.mMinimum = None
             return
         
+        m = self.metrics
+        if m is not None:
+            m.consolidations += 1
+        pool = self.pool
+
         # Handle the case where there is only one element in the heap
-        if current.prev == current.next == current:
+        if current.next is current:
              self.mMinimum = current
-             self.rootlist.head = None 
+             if m is not None:
+                 m.root_list_lengths.append(1)
+                 m.emit("consolidate", roots=1)
              return  
 
-        # since the list is circular, this avoids visiting a node more than once
-        visited_nodes = set()
+        # Degree table sized by the degree bound; slots are cleared again below
+        table = self.degree_table
+        size = int(math.log(self.node_count + 1) / LOG_PHI) + 2
+        if len(table) < size:
+            table.extend([None] * (size - len(table)))
+
+        # break the circle so the walk ends at the last root without a visited set
+        self.rootlist.last.next = None
+        roots = 0
         
-        while current and current not in visited_nodes: 
-            visited_nodes.add(current)
-            
+        while current is not None: 
+            roots += 1
             x = current
-            degree = current.degree
+            degree = x.degree
             current = current.next
 
             # Merge trees of the same degree
-            while degree in nodes and nodes[degree] is not None:
-                y = nodes[degree]
-
+            y = table[degree]
+            while y is not None:
                 #if x has a higher priority, swap places
                 if x.priority > y.priority:
                     y, x = x, y    
-                          
-                self.fib_Link(y, x)
-                nodes[degree] = None
-                
+
+                # make y a child of x; the root list is rebuilt below, so y does
+                # not need to be unlinked from it
+                children = x.children
+                if children is None:
+                    children = x.children = Fibtree() if pool is None else pool.tree()
+                children.add_to_root_list(y)
+                y.parent = x
+                y.mark = False
+                x.degree += 1
+                if m is not None:
+                    m.links += 1
+                    m.emit("link", child=y.key, parent=x.key, degree=x.degree)
+
+                table[degree] = None
                 degree += 1
+                y = table[degree]
                 
-            nodes[degree] = x
+            table[degree] = x
             
-        # Reset the minimum node and rebuild the root list    
-        self.mMinimum = None
-        self.rootlist.head = None
-        for trees in nodes.values():
-            if trees:
-                self.rootlist.add_to_root_list(trees)
-                if self.mMinimum is None or trees.priority < self.mMinimum.priority:
-                    self.mMinimum = trees
+        if m is not None:
+            m.root_list_lengths.append(roots)
+            m.emit("consolidate", roots=roots)
+
+        # Relink the surviving trees into the root list and track the minimum
+        first = last = minimum = None
+        for degree in range(size):
+            x = table[degree]
+            if x is None:
+                continue
+            table[degree] = None
+            if first is None:
+                first = minimum = x
+            else:
+                last.next = x
+                x.prev = last
+                if x.priority < minimum.priority:
+                    minimum = x
+            last = x
+        last.next = first
+        first.prev = last
+        self.rootlist.head = first
+        self.rootlist.last = last
+        self.mMinimum = minimum
             
         
     def extractMin(self):
@@ -350,38 +570,190 @@ class FibHeap:
         if self.isEmpty():
             raise ValueError("Empty Heap")
 
+        m = self.metrics
+        if m is not None and m.latency:
+            started = perf_counter()
+
         # ensure the element to be remove is the minimum
-        minElem = self.mMinimum
-      
-        if minElem is not None:
-            # Remove the key from the set
-            if minElem.key not in self.key_set:
-                print(f"DEBUG: Current key_set: {self.key_set}")
-                raise ValueError(f"Key '{minElem.key}' not found in key set during extraction.")
-
-            self.key_set.remove(minElem.key)
-            
-            child = minElem.children.head
-            if child is not None: 
+        minElem = self.remove_min()
+
+        if m is not None:
+            m.extracts += 1
+            m.emit("extract", key=minElem.key, priority=minElem.priority, node_count=self.node_count)
+            if m.latency:
+                m.observe("extractMin", perf_counter() - started)
+        if self.debug:
+            self.check_invariants()
+        return minElem
+
+
+    def __len__(self):
+        return self.node_count
+
+
+    def __iter__(self):
+        """
+        Yields every node of the heap in forest order (not sorted), without modifying
+        it. Use iter_sorted for ascending order.
+        """
+        if self.graveyard:
+            self.purge()
+        stack = list(self.iterate_list(self.rootlist))
+        stack.reverse()
+        while stack:
+            node = stack.pop()
+            yield node
+            if node.children is not None:
+                children = list(self.iterate_list(node.children))
+                children.reverse()
+                stack.extend(children)
+
+
+    def iter_sorted(self):
+        """
+        Lazily yields the nodes in ascending priority order without modifying the heap.
+
+        Heap order means a node can only come after its parent, so the forest is
+        explored through a small frontier heap that starts with the roots and receives
+        a node's children once that node is yielded. Taking the first k nodes costs
+        O(roots + k log k) instead of k destructive extractions. The heap must not be
+        modified while the generator is in use.
+
+        Yields:
+            Node: The nodes, smallest priority first.
+        """
+        if self.mMinimum is None:
+            return
+        if self.graveyard:
+            self.purge()
+        tie = count()
+        frontier = [(node.priority, next(tie), node) for node in self.iterate_list(self.rootlist)]
+        heapq.heapify(frontier)
+
+        while frontier:
+            node = heapq.heappop(frontier)[2]
+            yield node
+            if node.children is not None and node.children.head is not None:
+                child = first = node.children.head
                 while True:
-                    minElem.children.add_to_root_list(child)
-                    child.parent = None
+                    heapq.heappush(frontier, (child.priority, next(tie), child))
                     child = child.next
-                
-                    #break circular link
-                    if child == minElem.children.head:
+                    if child is first:
                         break
-                    
-            self.rootlist.remove_from_root_list(minElem)
-            
-            if minElem == minElem.next:
-                self.mMinimum = None 
-            else:
-                self.mMinimum = minElem.next
-                
-                self.consolidate() 
-            self.node_count -= 1
+
+
+    def nsmallest(self, k):
+        """
+        Returns the k nodes with the smallest priorities without modifying the heap.
+
+        Args:
+            k (int): The number of nodes to return.
+
+        Returns:
+            list: Up to k nodes in ascending priority order, taken from iter_sorted.
+        """
+        if k <= 0:
+            return []
+        return list(islice(self.iter_sorted(), k))
+
+
+    def pop_many(self, k):
+        """
+        Removes and returns the k nodes with the smallest priorities.
+
+        The nodes are found with nsmallest, unlinked together, and the root list is
+        consolidated once for the whole batch instead of once per node.
+
+        Args:
+            k (int): The number of nodes to remove.
+
+        Returns:
+            list: Up to k removed nodes in ascending priority order.
+        """
+        m = self.metrics
+        if m is not None and m.latency:
+            started = perf_counter()
+
+        chosen = self.nsmallest(k)
+        if not chosen:
+            return chosen
+
+        for node in chosen:
+            # every ancestor of node was removed before it, so node is a root by now
+            del self.index[node.key]
+            self.promote_children(node)
+            self.rootlist.remove_from_root_list(node)
+            node.mark = False
+        self.node_count -= len(chosen)
+
+        if self.rootlist.head is None:
+            self.mMinimum = None
+        else:
+            self.consolidate()
+
+        if m is not None:
+            m.extracts += len(chosen)
+            m.emit("pop_many", count=len(chosen), node_count=self.node_count)
+            if m.latency:
+                m.observe("pop_many", perf_counter() - started)
+        if self.debug:
+            self.check_invariants()
+        return chosen
+
+
+    def promote_children(self, node):
+        """
+        Moves every child of a node that is being removed onto the root list.
+
+        The emptied child list goes back to the pool, if there is one, and the node is
+        left with no children and degree 0. Leaves have no child list and are skipped.
+
+        Args:
+            node (Node): The node whose children become roots.
+        """
+        if node.children is None:
+            return
+        rootlist = self.rootlist
+        first = child = node.children.head
+        while child is not None:
+            following = child.next
+            rootlist.add_to_root_list(child)
+            child.parent = None
+
+            #break circular link
+            if following is first:
+                break
+            child = following
+        if self.pool is not None:
+            self.pool.release_tree(node.children)
+        node.children = None
+        node.degree = 0
+
+
+    def remove_min(self):
+        """
+        Unlinks the current minimum node from the heap and consolidates the rest.
+
+        This is the structural part of extractMin, shared with delete. The removed node
+        is left detached (no parent, siblings or children) so it can be re-added.
+
+        Returns:
+            Node: The removed node.
+        """
+        minElem = self.mMinimum
+
+        # Remove the key from the index
+        del self.index[minElem.key]
         
+        self.promote_children(minElem)
+        self.rootlist.remove_from_root_list(minElem)
+        minElem.mark = False
+        
+        if self.rootlist.head is None:
+            self.mMinimum = None 
+        else:
+            self.consolidate() 
+        self.node_count -= 1
         return minElem
     
     
@@ -405,9 +777,14 @@ class FibHeap:
             ValueError: If the new priority is greater than the current priority of x.
         """
         
+        m = self.metrics
+        if m is not None and m.latency:
+            started = perf_counter()
+
         # Check that the min-heap order property is not violated
         if priority > x.priority:
-            print(f"new {priority} is greater than {x.priority}")
+            if m is not None:
+                m.emit("decrease_ignored", key=x.key, priority=priority, current=x.priority)
             return
             
         # Update the priority of the node if new priority is smaller
@@ -424,8 +801,103 @@ class FibHeap:
         if x.priority < self.mMinimum.priority:
             #save x as the new heap minimum
             self.mMinimum =  x
+
+        if m is not None:
+            m.decreases += 1
+            m.emit("decrease", key=x.key, priority=priority)
+            if m.latency:
+                m.observe("fib_decrease", perf_counter() - started)
+        if self.debug:
+            self.check_invariants()
             
 
+    def decrease_many(self, updates):
+        """
+        Applies a batch of decrease-keys, as from relaxing every edge of one vertex.
+
+        The batch is validated up front and repeated updates of one key are coalesced
+        into the smallest priority. The new priorities are then written in one pass that
+        also cuts the nodes breaking heap order; those are spliced into the root list
+        together, the cascading cuts of their former parents run afterwards, and the
+        minimum is updated once. The priorities and the ignored entries are the same
+        as with fib_decrease for each entry in order.
+
+        Args:
+            updates: An iterable of (key or Node, priority) pairs.
+
+        Raises:
+            ValueError: If a key is not in the heap or a priority is invalid; the heap
+                is left unchanged.
+
+        Returns:
+            list: The pairs that were ignored because their priority was larger than
+            the key's priority at that point of the batch.
+        """
+        m = self.metrics
+        if m is not None and m.latency:
+            started = perf_counter()
+
+        pairs = list(updates)
+        priorities = self.checkPriorities([priority for _, priority in pairs])
+
+        # the smallest priority per node; an entry larger than the priority the node
+        # would have at its turn is ignored, and an equal one applied, as fib_decrease does
+        index = self.index if self.token is None else None
+        lowest = {}
+        ignored = []
+        for pair, priority in zip(pairs, priorities):
+            x = pair[0]
+            # plain index hits skip lookup, which also reports the errors
+            if index is None:
+                node = self.lookup(x)
+            elif type(x) is Node:
+                node = x if index.get(x.key) is x else self.lookup(x)
+            else:
+                node = index.get(x)
+                if node is None:
+                    node = self.lookup(x)
+            if priority <= lowest.get(node, node.priority):
+                lowest[node] = priority
+            else:
+                ignored.append(pair)
+
+        # apply the priorities and cut every node that breaks heap order; a node's
+        # children stay in order since it only got smaller, so one pass finds them all
+        minimum = self.mMinimum
+        cut = []
+        parents = []
+        for node, priority in lowest.items():
+            node.priority = priority
+            if priority < minimum.priority:
+                minimum = node
+            parent = node.parent
+            if parent is not None and priority < parent.priority:
+                parent.children.remove_from_root_list(node)
+                parent.degree -= 1
+                node.mark = False
+                cut.append(node)
+                parents.append(parent)
+        if cut:
+            for left, right in zip(cut, cut[1:]):
+                left.next = right
+                right.prev = left
+            self.rootlist.splice(cut[0], cut[-1])
+            for parent in parents:
+                self.cascadingCut(parent)
+        self.mMinimum = minimum
+
+        if m is not None:
+            # one decrease per applied entry, as with fib_decrease for each entry
+            m.decreases += len(pairs) - len(ignored)
+            m.cuts += len(cut)
+            m.emit("decrease_many", count=len(pairs) - len(ignored), ignored=len(ignored), cuts=len(cut))
+            if m.latency:
+                m.observe("decrease_many", perf_counter() - started)
+        if self.debug:
+            self.check_invariants()
+        return ignored
+
+
     def cut(self, x, y):
         """
         Cuts node x from its parent node y in the Fibonacci heap.
@@ -446,11 +918,8 @@ class FibHeap:
         if x.parent is None:
             raise ValueError("x does not have a parent")
             
-        #remove x from the childlist of y
-        y.remove_from_childlist(x)
-        
-        # Decrement the degree of y since x is no longer a child
-        y.degree -= 1
+        #remove x from the childlist of y; this also decrements the degree of y
+        y.remove_from_child_list(x)
         
         # Add x to the root list
         self.rootlist.add_to_root_list(x)
@@ -459,51 +928,469 @@ class FibHeap:
         x.parent = None
         x.mark = False
 
+        m = self.metrics
+        if m is not None:
+            m.cuts += 1
+            m.emit("cut", key=x.key, parent=y.key)
+
     def cascadingCut(self, y):
         """
         Performs a cascading cut operation on node y in the Fibonacci heap.
 
         This function marks node y if it is not already marked. If y is marked, 
-        it cuts y from its parent z and recursively applies cascading cut on z.
+        it cuts y from its parent z and continues with z, walking up the tree in a
+        loop so long cut chains cannot hit the recursion limit.
     
         Args:
             y: The node to perform cascading cut on. 
         """
         # initialize a variable z as y parent
         z = y.parent
-        if z is not None:
+        while z is not None:
             # If y is not marked, mark it. A node can be mark if it has lost a child
-            if y.mark == False:
+            if not y.mark:
                 y.mark = True
-            else:
-                # Cut y from its parent z
-                self.cut(y, z)
-                # Recursively apply cascading cut on parent z
-                self.cascadingCut(z)
+                return
+            # Cut y from its parent z and continue with z
+            self.cut(y, z)
+            if self.metrics is not None:
+                self.metrics.cascading_cuts += 1
+            y = z
+            z = y.parent
 
     def delete(self, x):
         """
         Deletes node x from the Fibonacci heap.
 
-        This function first decreases the key of node x to positive infinity,
-        effectively making it the minimum node, and then extracts the minimum node,
-        which removes x from the heap.
+        This function cuts x from its parent, effectively making it the minimum node,
+        and then removes the minimum node, which removes x from the heap. x may be
+        given either as a Node or by its key.
 
         Args:
-            x: The node to be deleted from the Fibonacci heap.
+            x: The node, or the key of the node, to be deleted from the Fibonacci heap.
     
         Raises:
             ValueError: If x is None or not found in the heap.
+
+        Returns:
+            Node: The deleted node, detached and with its priority unchanged.
         """
-        # Decrease the key of node x to positive infinity
-         self.fib_decrease(x, float('-inf'))
-        
-        # Extract the minimum node, which will remove x from the heap
-        self.extractMin()
+        m = self.metrics
+        if m is not None and m.latency:
+            started = perf_counter()
 
-        # Remove the node's key from the set
-        if node.key in self.key_set:
-            self.key_set.remove(node.key)
-            print(f"Node with key '{x.key}' has been successfully deleted.")
-        
+        node = self.lookup(x)
+
+        # Move x to the root list as if its key had been decreased to negative infinity
+        parent = node.parent
+        if parent is not None:
+            self.cut(node, parent)
+            self.cascadingCut(parent)
+        self.mMinimum = node
         
+        # Remove the minimum node, which is now x
+        self.remove_min()
+
+        if m is not None:
+            m.deletes += 1
+            m.emit("delete", key=node.key, node_count=self.node_count)
+            if m.latency:
+                m.observe("delete", perf_counter() - started)
+        if self.debug:
+            self.check_invariants()
+        return node
+
+
+    def discard(self, x):
+        """
+        Removes node x (or the node stored under key x) lazily, if it is in the heap.
+
+        See discard_many.
+
+        Args:
+            x: The node, or the key of the node, to remove.
+
+        Returns:
+            bool: True if x was in the heap.
+        """
+        try:
+            node = self.lookup(x)
+        except ValueError:
+            return False
+        return self.discard_many((node.key,)) == 1
+
+
+    def discard_many(self, keys):
+        """
+        Removes the nodes stored under keys lazily; keys not in the heap are skipped.
+
+        Each node is dropped from the index and tombstoned in O(1): it stays linked in
+        its tree until the next consolidation purges every tombstone in one pass. Only
+        when the current minimum is discarded does this consolidate right away, so the
+        minimum is always a live node. The graveyard is also purged once it outgrows
+        the live nodes, which bounds the memory held by tombstones. With a pool, purged
+        tombstones are recycled, so a handle to a discarded node must not be used again.
+
+        Args:
+            keys: An iterable of keys.
+
+        Returns:
+            int: The number of nodes removed.
+        """
+        graveyard = self.graveyard
+        removed = 0
+        minimum_removed = False
+        for key in keys:
+            node = self.get_node(key)
+            if node is None:
+                continue
+            del self.index[key]
+            graveyard.append(node)
+            if node is self.mMinimum:
+                minimum_removed = True
+            removed += 1
+        self.node_count -= removed
+
+        if minimum_removed:
+            self.consolidate()
+        elif len(graveyard) > self.node_count:
+            self.purge()
+
+        m = self.metrics
+        if m is not None and removed:
+            m.discards += removed
+            m.emit("discard", count=removed, node_count=self.node_count)
+        if self.debug:
+            self.check_invariants()
+        return removed
+
+
+    def purge(self):
+        """
+        Unlinks every tombstoned node from the forest in one pass.
+
+        A tombstone is cut from its parent (with the usual cascading cut) or removed
+        from the root list, and its children become roots. The root list is not
+        consolidated here; consolidate calls this first.
+        """
+        graveyard = self.graveyard
+        if not graveyard:
+            return
+        rootlist = self.rootlist
+        for node in graveyard:
+            parent = node.parent
+            if parent is not None:
+                parent.remove_from_child_list(node)
+                self.cascadingCut(parent)
+            else:
+                rootlist.remove_from_root_list(node)
+            self.promote_children(node)
+            node.mark = False
+            if self.pool is not None:
+                self.pool.release(node)
+
+        m = self.metrics
+        if m is not None:
+            m.purged += len(graveyard)
+            m.emit("purge", count=len(graveyard))
+        self.graveyard = []
+
+
+    def release(self, node):
+        """
+        Hands a removed node back to the pool once the caller is done with it.
+
+        extractMin, delete and pop_many return the removed nodes, so the heap cannot
+        tell when they are free; after release the node may be reused for another key
+        at any time. Without a pool this does nothing.
+
+        Args:
+            node (Node): A node removed from this heap.
+
+        Raises:
+            ValueError: If the node is still linked into a heap or was already released.
+        """
+        if self.pool is None:
+            return
+        if node.next is not None or self.index.get(node.key) is node:
+            raise ValueError(f"Node '{node.key}' is still in a heap.")
+        self.pool.release(node)
+
+
+    def lookup(self, x):
+        """
+        Resolves a key or a Node to the Node stored in this heap.
+
+        Args:
+            x: A key, or a Node previously returned by insert.
+
+        Raises:
+            ValueError: If x is None or its key is not in the heap.
+
+        Returns:
+            Node: The node stored under that key.
+        """
+        if x is None:
+            raise ValueError("x cannot be None")
+        key = x.key if isinstance(x, Node) else x
+        node = self.get_node(key)
+        if node is None or (isinstance(x, Node) and node is not x):
+            raise ValueError(f"Key '{key}' is not in the heap.")
+        return node
+
+
+    def get_node(self, key):
+        """
+        Returns the node stored under key in this heap, or None.
+
+        With a shared registry, a key held by a sibling heap is reported as missing.
+
+        Args:
+            key: The key to look up.
+
+        Returns:
+            Node: The node, or None if this heap does not hold the key.
+        """
+        node = self.index.get(key)
+        if node is not None and self.token is not None and node.owner.find() is not self.token:
+            return None
+        return node
+
+
+    def __contains__(self, key):
+        return self.get_node(key) is not None
+
+
+    def priority_of(self, key):
+        """
+        Returns the current priority stored for a key.
+
+        Args:
+            key: The key to look up.
+
+        Raises:
+            ValueError: If the key is not in the heap.
+
+        Returns:
+            float: The priority of the key's node.
+        """
+        return self.lookup(key).priority
+
+
+    def decrease_key(self, key, priority):
+        """
+        Decreases the priority of the node stored under key.
+
+        Args:
+            key: The key whose priority is decreased.
+            priority (float): The new, smaller priority.
+
+        Raises:
+            ValueError: If the key is not in the heap or the priority is invalid.
+
+        Returns:
+            Node: The node stored under key.
+        """
+        node = self.lookup(key)
+        self.decrease_checked(node, self.checkPriority(priority))
+        return node
+
+
+    def decrease_checked(self, x, priority):
+        """
+        fib_decrease for a priority that has already been through checkPriority.
+
+        decrease_key and update go through here, so a subclass whose fib_decrease
+        converts its argument (CompositeFibHeap packs it) overrides this one method to
+        skip the second conversion.
+        """
+        self.fib_decrease(x, priority)
+
+
+    def update(self, key, priority):
+        """
+        Sets the priority of key, inserting it if it is not in the heap yet.
+
+        A smaller priority is applied with fib_decrease. A larger one removes the node and
+        adds it back as a new root, so the returned Node stays valid either way.
+
+        Args:
+            key: The key to insert or re-prioritize.
+            priority (float): The new priority.
+
+        Raises:
+            ValueError: If the key or the priority is invalid.
+
+        Returns:
+            Node: The node stored under key.
+        """
+        node = self.get_node(key)
+        if node is None:
+            return self.insert(key, priority)
+
+        priority = self.checkPriority(priority)
+        if priority < node.priority:
+            self.decrease_checked(node, priority)
+        elif priority > node.priority:
+            self.delete(node)
+            node.priority = priority
+            self.add_root(node)
+        return node
+
+
+    def save(self, path):
+        """
+        Writes the heap to path in a compact binary layout that preserves the forest.
+
+        The nodes are written in preorder (roots in root-list order, children in
+        child-list order), so every parent comes before its children. The file holds a
+        SNAPSHOT_HEADER, the priorities as doubles, the parent indices as int64 (-1 for
+        roots), one mark byte per node, and finally the keys as one pickled list.
+        Because of the pickled keys, only load snapshots from a trusted source.
+
+        Args:
+            path: The file to write.
+        """
+        if self.graveyard:
+            self.purge()
+        nodes = []
+        parents = array("q")
+        stack = [(root, -1) for root in reversed(list(self.iterate_list(self.rootlist)))]
+        while stack:
+            node, parent = stack.pop()
+            parents.append(parent)
+            position = len(nodes)
+            nodes.append(node)
+            if node.children is not None:
+                stack.extend((child, position) for child in reversed(list(self.iterate_list(node.children))))
+
+        n = len(nodes)
+        minimum = -1
+        for position, node in enumerate(nodes):
+            if node is self.mMinimum:
+                minimum = position
+                break
+        keys_offset = SNAPSHOT_HEADER.size + 17 * n
+        with open(path, "wb") as handle:
+            handle.write(SNAPSHOT_HEADER.pack(SNAPSHOT_MAGIC, SNAPSHOT_VERSION, sys.byteorder == "little",
+                                              n, minimum, keys_offset))
+            array("d", [node.priority for node in nodes]).tofile(handle)
+            parents.tofile(handle)
+            handle.write(bytes(node.mark for node in nodes))
+            pickle.dump([node.key for node in nodes], handle, protocol=pickle.HIGHEST_PROTOCOL)
+
+
+    @classmethod
+    def load(cls, path, metrics=None):
+        """
+        Rebuilds a heap saved with save, with exactly the same trees, marks and minimum.
+
+        The file is memory-mapped, the node arrays are converted straight from the
+        mapping, and the nodes are rebuilt in one linear pass without consolidation.
+        The layout is checked on the way: the file length, parents that come before
+        their children, heap order, unique keys and the minimum.
+
+        The keys are unpickled, which can run arbitrary code: only load snapshots
+        from a trusted source.
+
+        Args:
+            path: The file to read.
+            metrics (HeapMetrics): Optional instrumentation for the new heap.
+
+        Raises:
+            ValueError: If the file is not a heap snapshot, was written with another
+                format version or byte order, or is truncated or inconsistent.
+
+        Returns:
+            FibHeap: The restored heap.
+        """
+        heap = cls(metrics)
+        with open(path, "rb") as handle:
+            head = handle.read(SNAPSHOT_HEADER.size)
+            if len(head) < SNAPSHOT_HEADER.size:
+                raise ValueError(f"'{path}' is not a heap snapshot.")
+            magic, version, little, n, minimum, keys_offset = SNAPSHOT_HEADER.unpack(head)
+            if magic != SNAPSHOT_MAGIC:
+                raise ValueError(f"'{path}' is not a heap snapshot.")
+            if version != SNAPSHOT_VERSION:
+                raise ValueError(f"Unsupported snapshot version {version}.")
+            if bool(little) != (sys.byteorder == "little"):
+                raise ValueError("The snapshot was written with a different byte order.")
+            size = os.fstat(handle.fileno()).st_size
+            if n < 0 or keys_offset != SNAPSHOT_HEADER.size + 17 * n or size <= keys_offset:
+                raise ValueError(f"'{path}' is truncated or its header is corrupt.")
+            if n == 0:
+                return heap
+            if not 0 <= minimum < n:
+                raise ValueError(f"Snapshot minimum {minimum} is outside 0..{n - 1}.")
+
+            with mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as mapped, memoryview(mapped) as view:
+                start = SNAPSHOT_HEADER.size
+                # tolist() converts each typed block in C; iterating the casts is far slower
+                with view[start:start + 8 * n].cast("d") as block:
+                    priorities = block.tolist()
+                with view[start + 8 * n:start + 16 * n].cast("q") as block:
+                    parents = block.tolist()
+                marks = bytes(view[start + 16 * n:keys_offset])
+                try:
+                    keys = pickle.loads(view[keys_offset:])
+                except Exception as exc:
+                    raise ValueError(f"The keys of '{path}' cannot be read: {exc}") from exc
+
+        if not isinstance(keys, list) or len(keys) != n:
+            raise ValueError(f"'{path}' does not hold {n} keys.")
+        # every parent must come before its child, as save writes them in preorder
+        if min(parents) < -1 or any(map(operator.ge, parents, range(n))):
+            raise ValueError(f"'{path}' has a parent index that does not precede its child.")
+        if any(map(math.isnan, priorities)):
+            raise ValueError(f"'{path}' holds a NaN priority.")
+        if parents[minimum] != -1 or min(priorities) < priorities[minimum]:
+            raise ValueError(f"'{path}' does not point at the minimum root.")
+
+        # the rebuild only allocates; pausing the cyclic GC avoids rescanning the new
+        # nodes on every generation threshold, which more than doubles the load time
+        collecting = gc.isenabled()
+        gc.disable()
+        try:
+            nodes = list(map(Node, keys, priorities))
+            rootlist = heap.rootlist
+            for node, parent, mark in zip(nodes, parents, marks):
+                if mark:
+                    node.mark = True
+                if parent < 0:
+                    rootlist.add_to_root_list(node)
+                    continue
+                above = nodes[parent]
+                if node.priority < above.priority:
+                    raise ValueError(f"'{path}' breaks heap order at key '{node.key}'.")
+                if above.children is None:
+                    above.children = Fibtree()
+                above.children.add_to_root_list(node)
+                node.parent = above
+                above.degree += 1
+        finally:
+            if collecting:
+                gc.enable()
+
+        try:
+            heap.index.update(zip(keys, nodes))
+        except TypeError:
+            raise ValueError(f"'{path}' holds a key that is not hashable.")
+        if len(heap.index) != n or None in heap.index:
+            raise ValueError(f"'{path}' holds a duplicate or None key.")
+        heap.mMinimum = nodes[minimum]
+        heap.node_count = n
+        return heap
+
+
+    def iterate_list(self, tree):
+        """
+        Yields the nodes of a circular list (the root list or a child list) in order.
+        """
+        first = node = tree.head
+        while node is not None:
+            yield node
+            node = node.next
+            if node is first:
+                break
+
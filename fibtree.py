@@ -21,6 +21,11 @@ class Fibtree:
                 Returns:
                  None
             
+            splice(first, last):
+                Appends a linked chain of nodes to the root list.
+                Returns:
+                    None
+
             remove_from_root_list(node): 
                 Removes a specified node from the root list.
                 Returns:
@@ -31,6 +36,8 @@ class Fibtree:
                 Returns:
                     None
         """  
+    __slots__ = ("head", "last")
+
     def __init__(self):
         # Initialize the head and last pointers of the root list to None.
         self.head = None
@@ -66,6 +73,31 @@ class Fibtree:
             self.last = node
     
     
+    def splice(self, first, last):
+        """
+        Append a chain of already linked nodes to the root list in one step.
+
+        The chain runs from first to last through the next/prev pointers; its outer
+        pointers may be anything, since they are overwritten here to close the circle.
+
+        Args:
+            first: The first node of the chain.
+            last: The last node of the chain.
+
+        Returns:
+            None
+        """
+        if not self.head:
+            self.head = first
+        else:
+            self.last.next = first
+            first.prev = self.last
+        self.last = last
+        # close the circle around the combined list
+        last.next = self.head
+        self.head.prev = last
+
+
     def remove_from_root_list(self, node):
         """
         Remove a node from the root list of the Fibonacci heap.
@@ -88,14 +120,12 @@ class Fibtree:
         if not self.head:
             raise ValueError("cant remove from empty list")
         
-        print(f"removing node: {node.key}")
         if node is None:
            raise ValueError("node doen't exist") 
        
         # If the node to remove is the head of the list (the minimum node).
         if node == self.head:
             if self.head == self.last:
-               print("node is the only element in list")
                self.head =  self.last = None    
                   
             else:
@@ -105,6 +135,9 @@ class Fibtree:
                 node.next.prev = node.prev
               
         else: 
+            # Keep the last pointer valid when the tail is removed.
+            if node == self.last:
+                self.last = node.prev
             node.prev.next = node.next
             node.next.prev = node.prev
             
@@ -0,0 +1,138 @@
+import math
+
+from fibonacciHeap import LOG_PHI
+
+
+def walk_list(tree, where):
+    """
+    Returns the nodes of a circular list after checking its links.
+
+    Args:
+        tree (Fibtree): The root list or a child list.
+        where (str): Names the list in error messages.
+
+    Raises:
+        ValueError: If a next/prev pair disagrees, last is not head.prev, or the list
+            does not close into a circle.
+    """
+    head = tree.head
+    if head is None:
+        if tree.last is not None:
+            raise ValueError(f"{where}: empty list with a last pointer.")
+        return []
+    nodes = []
+    seen = set()
+    node = head
+    while True:
+        if id(node) in seen:
+            raise ValueError(f"{where}: the list loops back to a node other than head.")
+        seen.add(id(node))
+        nodes.append(node)
+        if node.next is None or node.next.prev is not node:
+            raise ValueError(f"{where}: broken next/prev link at key '{node.key}'.")
+        node = node.next
+        if node is head:
+            break
+    if tree.last is not head.prev:
+        raise ValueError(f"{where}: last is not the node before head.")
+    return nodes
+
+
+def check_invariants(heap):
+    """
+    Audits a FibHeap and raises on the first broken invariant.
+
+    This is the slow, thorough counterpart of the operations' fast paths, which no
+    longer check their own preconditions. It walks the whole forest and verifies:
+
+        - circular-list integrity of the root list and every child list
+        - parent pointers, and that roots have no parent
+        - heap order: no child has a smaller priority than its parent
+        - degree counts against the actual child lists
+        - the mark rule, through its consequence: a node of degree d roots a
+          subtree of at least F(d+2) nodes
+        - the degree bound log_phi(n)
+        - node_count and the index against the nodes found (tombstones included)
+        - mMinimum: a live root with the smallest priority among the roots
+
+    The whole audit is O(n). Enable it after every operation with FibHeap(debug=True),
+    or call heap.check_invariants() from tests.
+
+    Args:
+        heap (FibHeap): The heap to audit.
+
+    Raises:
+        ValueError: Describing the first violation found.
+    """
+    roots = walk_list(heap.rootlist, "root list")
+    graveyard = {id(node) for node in heap.graveyard}
+    total = 0
+    max_degree = 0
+    for root in roots:
+        if root.parent is not None:
+            raise ValueError(f"Root '{root.key}' has a parent.")
+        # iterative post-order walk that computes subtree sizes
+        stack = [(root, False)]
+        sizes = {}
+        while stack:
+            node, expanded = stack.pop()
+            children = walk_list(node.children, f"children of '{node.key}'") if node.children is not None else []
+            if expanded:
+                size = 1 + sum(sizes.pop(id(child)) for child in children)
+                if size < fibonacci(node.degree + 2):
+                    raise ValueError(
+                        f"Node '{node.key}' has degree {node.degree} but only {size} nodes in its subtree; "
+                        "the mark rule was broken.")
+                sizes[id(node)] = size
+                continue
+            total += 1
+            if len(children) != node.degree:
+                raise ValueError(f"Node '{node.key}' has degree {node.degree} but {len(children)} children.")
+            max_degree = max(max_degree, node.degree)
+            if id(node) not in graveyard:
+                stored = heap.index.get(node.key)
+                if stored is not node:
+                    raise ValueError(f"Node '{node.key}' is in the forest but not in the index.")
+                if heap.token is not None and node.owner.find() is not heap.token:
+                    raise ValueError(f"Node '{node.key}' is not owned by this heap.")
+            stack.append((node, True))
+            for child in children:
+                if child.parent is not node:
+                    raise ValueError(f"Child '{child.key}' does not point back to parent '{node.key}'.")
+                if child.priority < node.priority:
+                    raise ValueError(
+                        f"Heap order violated: child '{child.key}' ({child.priority}) is below "
+                        f"parent '{node.key}' ({node.priority}).")
+                stack.append((child, False))
+
+    if total != heap.node_count + len(heap.graveyard):
+        raise ValueError(
+            f"node_count is {heap.node_count} with {len(heap.graveyard)} tombstones, "
+            f"but the forest holds {total} nodes.")
+    if heap.token is None and len(heap.index) != heap.node_count:
+        raise ValueError(f"The index holds {len(heap.index)} keys but node_count is {heap.node_count}.")
+    if total and max_degree > math.log(total) / LOG_PHI + 1e-9:
+        raise ValueError(f"Degree {max_degree} exceeds the log_phi bound for {total} nodes.")
+
+    minimum = heap.mMinimum
+    if not roots:
+        if minimum is not None:
+            raise ValueError("The forest is empty but mMinimum is set.")
+        return
+    if minimum is None or minimum.parent is not None or all(root is not minimum for root in roots):
+        raise ValueError("mMinimum is not a root.")
+    if id(minimum) in graveyard:
+        raise ValueError(f"mMinimum '{minimum.key}' is a tombstone.")
+    if any(root.priority < minimum.priority for root in roots):
+        raise ValueError("mMinimum does not hold the smallest root priority.")
+
+
+def fibonacci(k):
+    """
+    Returns:
+        int: The k-th Fibonacci number, with F(0) = 0 and F(1) = 1.
+    """
+    a, b = 0, 1
+    for _ in range(k):
+        a, b = b, a + b
+    return a
@@ -0,0 +1,168 @@
+import math
+
+
+class LatencyHistogram:
+    """
+        A log2-bucketed latency histogram for a single heap operation.
+
+        Bucket i counts the calls whose duration fell in [2**i, 2**(i+1)) nanoseconds,
+        so the histogram has a fixed, small size no matter how many samples it sees.
+
+        Attributes:
+            buckets (list): Sample counts per power-of-two nanosecond bucket.
+            count (int): The total number of recorded samples.
+            total (float): The sum of all recorded durations, in seconds.
+    """
+    def __init__(self):
+        self.buckets = [0] * 64
+        self.count = 0
+        self.total = 0.0
+
+    def record(self, seconds):
+        """
+        Record one duration.
+
+        Args:
+            seconds (float): The measured duration in seconds.
+        """
+        nanos = int(seconds * 1e9)
+        index = nanos.bit_length() - 1 if nanos > 0 else 0
+        self.buckets[min(index, 63)] += 1
+        self.count += 1
+        self.total += seconds
+
+    def mean(self):
+        """
+        Returns:
+            float: The mean recorded duration in seconds, or 0.0 when empty.
+        """
+        return self.total / self.count if self.count else 0.0
+
+    def percentile(self, q):
+        """
+        Estimate a percentile from the bucket counts.
+
+        Args:
+            q (float): The percentile to estimate, between 0 and 100.
+
+        Returns:
+            float: The upper bound of the bucket holding the percentile, in seconds.
+        """
+        if not self.count:
+            return 0.0
+        target = math.ceil(self.count * q / 100.0)
+        seen = 0
+        for index, hits in enumerate(self.buckets):
+            seen += hits
+            if seen >= target:
+                return (2 ** (index + 1)) / 1e9
+        return (2 ** 64) / 1e9
+
+
+class HeapMetrics:
+    """
+        Opt-in instrumentation for a Fibonacci heap.
+
+        A heap only touches its metrics object when one is attached, so the default
+        (no metrics) path pays a single `is None` check per operation and writes
+        nothing to stdout.
+
+        Args:
+            latency: When True, time the public operations into LatencyHistograms.
+            callback: Optional callable invoked as callback(event, fields) for every
+                event the heap emits (e.g. "insert", "link", "cut", "consolidate").
+
+        Attributes:
+            inserts, extracts, decreases, deletes, unions: Public operation counters.
+            links: The number of fib_Link calls made while consolidating.
+            cuts: The number of nodes cut from their parent.
+            cascading_cuts: The number of cuts caused by cascadingCut.
+            consolidations: The number of consolidate passes.
+            discards: The number of nodes tombstoned by discard / discard_many.
+            purged: The number of tombstoned nodes unlinked by purge.
+            root_list_lengths (list): The root-list length seen by each consolidate.
+            latencies (dict): Operation name to LatencyHistogram, when latency is on.
+    """
+    def __init__(self, latency=False, callback=None):
+        self.latency = latency
+        self.callback = callback
+        self.latencies = {}
+        self.reset()
+
+    def reset(self):
+        """
+        Reset every counter and histogram to zero.
+        """
+        self.inserts = 0
+        self.extracts = 0
+        self.decreases = 0
+        self.deletes = 0
+        self.unions = 0
+        self.links = 0
+        self.cuts = 0
+        self.cascading_cuts = 0
+        self.consolidations = 0
+        self.discards = 0
+        self.purged = 0
+        self.root_list_lengths = []
+        self.latencies.clear()
+
+    def emit(self, event, **fields):
+        """
+        Forward an event to the callback, if one is registered.
+
+        Args:
+            event (str): The event name.
+            **fields: Event-specific details such as key, priority or degree.
+        """
+        if self.callback is not None:
+            self.callback(event, fields)
+
+    def observe(self, operation, seconds):
+        """
+        Record the duration of one public operation.
+
+        Args:
+            operation (str): The operation name, e.g. "insert".
+            seconds (float): The measured duration in seconds.
+        """
+        histogram = self.latencies.get(operation)
+        if histogram is None:
+            histogram = self.latencies[operation] = LatencyHistogram()
+        histogram.record(seconds)
+
+    def snapshot(self):
+        """
+        Returns:
+            dict: The counters as plain values, suitable for logging or JSON export.
+        """
+        return {
+            "inserts": self.inserts,
+            "extracts": self.extracts,
+            "decreases": self.decreases,
+            "deletes": self.deletes,
+            "unions": self.unions,
+            "links": self.links,
+            "cuts": self.cuts,
+            "cascading_cuts": self.cascading_cuts,
+            "consolidations": self.consolidations,
+            "discards": self.discards,
+            "purged": self.purged,
+            "root_list_lengths": list(self.root_list_lengths),
+            "latencies": {
+                operation: {"count": h.count, "mean": h.mean(), "p99": h.percentile(99)}
+                for operation, h in self.latencies.items()
+            },
+        }
+
+
+def print_event(event, fields):
+    """
+    A ready-made callback that restores the old verbose output.
+
+    Args:
+        event (str): The event name.
+        fields (dict): The event details.
+    """
+    details = ", ".join(f"{name}={value}" for name, value in fields.items())
+    print(f"{event}: {details}")
@@ -0,0 +1,118 @@
+from fibtree import Fibtree
+from nodes import Node
+
+
+class NodePool:
+    """
+        An opt-in free list of Nodes and child-list Fibtrees for FibHeap.
+
+        Steady-state queues extract and insert at the same rate, so every operation
+        would allocate a Node (and, once it is linked, a Fibtree) only for the garbage
+        collector to free another one. A heap created with FibHeap(pool=NodePool())
+        takes nodes for insert and insert_many from the pool, and recycles emptied
+        child lists for consolidate.
+
+        A node is only reused once nothing can still refer to it, which the pool does
+        not guess. The heap hands back on its own only the nodes that no caller can be
+        using: tombstones unlinked by purge, whose handles discard has already ended.
+        extractMin, delete and pop_many return the removed nodes to the caller, who
+        passes each one to FibHeap.release once done with it. A node that is never
+        released is simply left to the garbage collector.
+
+        One pool may serve several heaps of one thread.
+
+        Attributes:
+            capacity (int): The maximum number of free nodes (and of free trees) kept.
+            nodes (dict): Released nodes as keys, most recent last; a dict so that
+                releasing a node twice is caught in O(1).
+            trees (list): Emptied child lists.
+            hits (int): Nodes handed out from the pool.
+            misses (int): Nodes that had to be allocated.
+            dropped (int): Nodes not kept because the pool was full.
+    """
+
+    def __init__(self, capacity=1024):
+        """
+        Args:
+            capacity (int): The maximum number of free nodes (and of free trees) kept.
+
+        Raises:
+            ValueError: If capacity is negative.
+        """
+        if capacity < 0:
+            raise ValueError(f"capacity cannot be negative, got {capacity}.")
+        self.capacity = capacity
+        self.nodes = {}
+        self.trees = []
+        self.reset()
+
+
+    def reset(self):
+        """
+        Reset the statistics to zero; the free lists are kept.
+        """
+        self.hits = 0
+        self.misses = 0
+        self.dropped = 0
+
+
+    def acquire(self, key, priority):
+        """
+        Returns a detached node holding key and priority, reused when possible.
+        """
+        if self.nodes:
+            node = self.nodes.popitem()[0]
+            node.key = key
+            node.priority = priority
+            node.owner = None
+            self.hits += 1
+            return node
+        self.misses += 1
+        return Node(key, priority)
+
+
+    def release(self, node):
+        """
+        Takes back a node that was removed from its heap and is no longer used.
+
+        The node must already be detached: no parent, siblings or children.
+
+        Raises:
+            ValueError: If the node was already released.
+        """
+        if node in self.nodes:
+            raise ValueError(f"Node '{node.key}' was already released to the pool.")
+        if len(self.nodes) < self.capacity:
+            self.nodes[node] = None
+        else:
+            self.dropped += 1
+
+
+    def tree(self):
+        """
+        Returns an empty Fibtree, reused when possible.
+        """
+        return self.trees.pop() if self.trees else Fibtree()
+
+
+    def release_tree(self, tree):
+        """
+        Takes back the child list of a removed node once its children have moved away.
+        """
+        if len(self.trees) < self.capacity:
+            tree.head = tree.last = None
+            self.trees.append(tree)
+
+
+    def snapshot(self):
+        """
+        Returns:
+            dict: The statistics and free-list sizes as plain values.
+        """
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "dropped": self.dropped,
+            "free_nodes": len(self.nodes),
+            "free_trees": len(self.trees),
+        }
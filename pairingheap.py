@@ -0,0 +1,219 @@
+from fibonacciHeap import FibHeap
+from priorityqueue import MergeablePriorityQueue
+
+
+class PairingNode:
+    """
+        A pairing-heap entry.
+
+        Children form a doubly linked list through child/sibling/prev, where prev points
+        to the left sibling, or to the parent for a first child.
+
+        Attributes:
+            key: The unique identifier of the entry.
+            priority: The priority value used for ordering.
+            child: The first child, or None.
+            sibling: The next sibling to the right, or None.
+            prev: The left sibling, or the parent for a first child; None for the root.
+    """
+    __slots__ = ("key", "priority", "child", "sibling", "prev")
+
+    def __init__(self, key, priority):
+        self.key = key
+        self.priority = priority
+        self.child = None
+        self.sibling = None
+        self.prev = None
+
+    def __str__(self) -> str:
+        return f"Key: {self.key}, Priority: {self.priority}"
+
+
+class PairingHeap(MergeablePriorityQueue):
+    """
+        A pairing heap: a single heap-ordered tree with two-pass extract-min.
+
+        insert, fib_Union and fib_decrease are O(1) (a meld or a cut plus a meld);
+        extractMin is O(log n) amortized. Its constant factors are small, which usually
+        makes it the fastest decrease-key backend in Python.
+
+        Attributes:
+            root (PairingNode): The minimum entry, or None when empty.
+            index (dict): Maps every key to its node.
+            node_count (int): The number of entries.
+    """
+    handle_type = PairingNode
+    checkKey = FibHeap.checkKey
+    checkPriority = FibHeap.checkPriority
+
+    def __init__(self):
+        self.root = None
+        self.index = {}
+        self.node_count = 0
+
+
+    def insert(self, key, priority):
+        """
+        Inserts key with priority.
+
+        Raises:
+            ValueError: If the key is invalid or already present, or the priority is invalid.
+
+        Returns:
+            PairingNode: The new node.
+        """
+        self.checkKey(key)
+        if key in self.index:
+            raise ValueError(f"Duplicate key '{key}' is not allowed.")
+        node = PairingNode(key, self.checkPriority(priority))
+        self.index[key] = node
+        self.root = node if self.root is None else self.meld(self.root, node)
+        self.node_count += 1
+        return node
+
+
+    def meld(self, a, b):
+        """
+        Links two tree roots; the one with the larger priority becomes the first child.
+
+        Returns:
+            PairingNode: The surviving root.
+        """
+        if b.priority < a.priority:
+            a, b = b, a
+        first = a.child
+        b.sibling = first
+        if first is not None:
+            first.prev = b
+        b.prev = a
+        a.child = b
+        return a
+
+
+    def combine(self, first):
+        """
+        Melds a sibling list into one tree with the standard two-pass pairing.
+
+        Args:
+            first (PairingNode): The first node of the sibling list, or None.
+
+        Returns:
+            PairingNode: The root of the combined tree, or None.
+        """
+        if first is None:
+            return None
+        # first pass: meld neighbours left to right
+        pairs = []
+        node = first
+        while node is not None:
+            a = node
+            b = node.sibling
+            if b is None:
+                a.prev = a.sibling = None
+                pairs.append(a)
+                break
+            node = b.sibling
+            a.prev = a.sibling = b.prev = b.sibling = None
+            pairs.append(self.meld(a, b))
+        # second pass: meld the results right to left
+        tree = pairs.pop()
+        while pairs:
+            tree = self.meld(pairs.pop(), tree)
+        return tree
+
+
+    def isEmpty(self):
+        return self.root is None
+
+
+    def getMin(self):
+        return self.root
+
+
+    def extractMin(self):
+        """
+        Removes the minimum node and pairs up its children.
+
+        Raises:
+            ValueError: If the heap is empty.
+
+        Returns:
+            PairingNode: The removed node.
+        """
+        root = self.root
+        if root is None:
+            raise ValueError("Empty Heap")
+        self.root = self.combine(root.child)
+        root.child = None
+        del self.index[root.key]
+        self.node_count -= 1
+        return root
+
+
+    def detach(self, x):
+        """
+        Unlinks the subtree rooted at x from its parent or left sibling.
+        """
+        if x.prev.child is x:
+            x.prev.child = x.sibling
+        else:
+            x.prev.sibling = x.sibling
+        if x.sibling is not None:
+            x.sibling.prev = x.prev
+        x.prev = x.sibling = None
+
+
+    def fib_decrease(self, x, priority):
+        """
+        Lowers the priority of x, cutting its subtree and melding it with the root.
+
+        Larger priorities are ignored, like FibHeap.fib_decrease.
+        """
+        if priority > x.priority:
+            return
+        x.priority = priority
+        if x is not self.root:
+            self.detach(x)
+            self.root = self.meld(self.root, x)
+
+
+    def delete(self, x):
+        """
+        Removes the node x (or the node stored under key x).
+
+        Raises:
+            ValueError: If x is not in the heap.
+
+        Returns:
+            PairingNode: The removed node.
+        """
+        node = self.lookup(x)
+        if node is self.root:
+            return self.extractMin()
+        self.detach(node)
+        rest = self.combine(node.child)
+        node.child = None
+        if rest is not None:
+            self.root = self.meld(self.root, rest)
+        del self.index[node.key]
+        self.node_count -= 1
+        return node
+
+
+    def fib_Union(self, other):
+        """
+        Melds other into this heap in O(1) plus the index merge.
+
+        Raises:
+            ValueError: If the heaps share a key.
+
+        Returns:
+            PairingHeap: This heap.
+        """
+        self.merge_index(other)
+        if other.root is not None:
+            self.root = other.root if self.root is None else self.meld(self.root, other.root)
+        self.node_count += other.node_count
+        other.root = None
+        other.node_count = 0
+        return self
@@ -0,0 +1,196 @@
+from abc import ABC, abstractmethod
+from importlib import import_module
+
+
+class MergeablePriorityQueue(ABC):
+    """
+        The interface shared by every priority-queue backend in this package.
+
+        The method names follow FibHeap, so a call site written against FibHeap works
+        unchanged with any backend. Handles returned by insert expose .key and
+        .priority; extractMin and delete return the removed handle.
+
+        Backends set handle_type to their handle class, keep a dict named index that
+        maps each key to its handle, and expose node_count. The key-based helpers
+        (lookup, __contains__, __len__, priority_of, decrease_key, update) are
+        implemented here on top of those and the abstract operations.
+    """
+
+    @abstractmethod
+    def insert(self, key, priority):
+        """Adds key with priority and returns its handle."""
+
+    @abstractmethod
+    def getMin(self):
+        """Returns the handle with the smallest priority, or None if empty."""
+
+    @abstractmethod
+    def extractMin(self):
+        """Removes and returns the handle with the smallest priority."""
+
+    @abstractmethod
+    def fib_Union(self, other):
+        """Moves every entry of other (same backend) into this queue and returns it."""
+
+    @abstractmethod
+    def fib_decrease(self, x, priority):
+        """Lowers the priority of handle x; larger priorities are ignored."""
+
+    @abstractmethod
+    def delete(self, x):
+        """Removes the handle x (or the handle stored under key x) and returns it."""
+
+    @abstractmethod
+    def isEmpty(self):
+        """Returns True if the queue holds no entries."""
+
+
+    def lookup(self, x):
+        """
+        Resolves a key or a handle to the handle stored in this queue.
+
+        Raises:
+            ValueError: If x is None or its key is not in the queue.
+        """
+        if x is None:
+            raise ValueError("x cannot be None")
+        is_handle = isinstance(x, self.handle_type)
+        key = x.key if is_handle else x
+        handle = self.index.get(key)
+        if handle is None or (is_handle and handle is not x):
+            raise ValueError(f"Key '{key}' is not in the heap.")
+        return handle
+
+    def __len__(self):
+        return self.node_count
+
+    def __contains__(self, key):
+        return key in self.index
+
+    def priority_of(self, key):
+        """Returns the priority stored under key."""
+        return self.lookup(key).priority
+
+    def decrease_key(self, key, priority):
+        """Decreases the priority stored under key and returns its handle."""
+        handle = self.lookup(key)
+        self.fib_decrease(handle, self.checkPriority(priority))
+        return handle
+
+    def update(self, key, priority):
+        """
+        Sets the priority of key, inserting it if needed.
+
+        Returns:
+            The handle now stored under key.
+        """
+        handle = self.index.get(key)
+        if handle is None:
+            return self.insert(key, priority)
+        priority = self.checkPriority(priority)
+        if priority < handle.priority:
+            self.fib_decrease(handle, priority)
+        elif priority > handle.priority:
+            self.delete(handle)
+            handle = self.insert(key, priority)
+        return handle
+
+    def merge_index(self, other):
+        """
+        Moves other's index into this one, checking the smaller against the larger.
+
+        Raises:
+            ValueError: If the two queues share a key. Neither index is modified.
+        """
+        larger, smaller = self.index, other.index
+        if len(smaller) > len(larger):
+            larger, smaller = smaller, larger
+        for key in smaller:
+            if key in larger:
+                raise ValueError(f"Duplicate key '{key}' found during union.")
+        larger.update(smaller)
+        self.index = larger
+        other.index = {}
+
+
+# backend name -> (module, class); imported on first use
+BACKENDS = {
+    "fibonacci": ("fibonacciHeap", "FibHeap"),
+    "pairing": ("pairingheap", "PairingHeap"),
+    "binary": ("binaryheap", "IndexedBinaryHeap"),
+    "rankpairing": ("rankpairing", "RankPairingHeap"),
+    "radix": ("radixheap", "RadixHeap"),
+}
+
+
+def backend_class(name):
+    """
+    Returns the queue class registered under name.
+
+    Raises:
+        ValueError: If no backend has that name.
+    """
+    if name not in BACKENDS:
+        raise ValueError(f"Unknown backend '{name}'. Choose one of: {', '.join(sorted(BACKENDS))}.")
+    module, attribute = BACKENDS[name]
+    return getattr(import_module(module), attribute)
+
+
+def choose_backend(decrease_ratio=0.0, union_ratio=0.0, guaranteed_bounds=False, monotone=False):
+    """
+    Picks a backend name from declared workload hints.
+
+    The thresholds come from benchmarks/suite.py on CPython 3.11 at n=20,000:
+
+        - The binary heap is fastest at extract-min (about 3x FibHeap) and on sparse
+          Dijkstra, so it wins whenever decrease-key and union are rare.
+        - The pairing heap has the cheapest decrease-key (about 2.5x FibHeap on the
+          decrease workload), so it wins once decrease-keys outnumber extractions.
+        - Union rebuilds the binary heap's array, which is over 100x slower than a
+          FibHeap splice, so any regular union picks FibHeap.
+        - The pairing heap's O(1) decrease-key is not a proven bound. When the caller
+          needs the proven amortized bounds, the rank-pairing heap replaces both.
+        - Monotone integer priorities (never below the last extracted minimum) pick
+          the radix heap, whose operations are bucket appends and integer XORs.
+
+    Args:
+        decrease_ratio (float): Expected decrease-key calls per extract-min.
+        union_ratio (float): Expected unions per extract-min.
+        guaranteed_bounds (bool): Require proven amortized O(1) decrease-key and union.
+        monotone (bool): Priorities are integers that never go below the last
+            extracted minimum.
+
+    Returns:
+        str: A key of BACKENDS.
+    """
+    if monotone:
+        return "radix"
+    if guaranteed_bounds and (decrease_ratio >= 1.0 or union_ratio >= 0.01):
+        return "rankpairing"
+    if union_ratio >= 0.01:
+        return "fibonacci"
+    if decrease_ratio >= 2.0:
+        return "pairing"
+    return "binary"
+
+
+def make_priority_queue(backend=None, decrease_ratio=0.0, union_ratio=0.0, guaranteed_bounds=False,
+                        monotone=False, **options):
+    """
+    Creates a priority queue, either the named backend or one chosen from workload hints.
+
+    Args:
+        backend (str): A key of BACKENDS; overrides the hints when given.
+        decrease_ratio (float): Expected decrease-key calls per extract-min.
+        union_ratio (float): Expected unions per extract-min.
+        guaranteed_bounds (bool): Require proven amortized O(1) decrease-key and union.
+        monotone (bool): Priorities are integers that never go below the last
+            extracted minimum.
+        **options: Passed to the backend's constructor (e.g. metrics for FibHeap).
+
+    Returns:
+        MergeablePriorityQueue: The new, empty queue.
+    """
+    if backend is None:
+        backend = choose_backend(decrease_ratio, union_ratio, guaranteed_bounds, monotone)
+    return backend_class(backend)(**options)
@@ -0,0 +1,376 @@
+import multiprocessing
+from math import inf as infinity
+from multiprocessing import shared_memory
+
+from fibonacciHeap import FibHeap
+
+# a batch reply carries at most this many error messages, each at most ERROR_LENGTH
+# characters, so replies stay small enough that unread ones never fill the pipe
+MAX_BATCH_ERRORS = 8
+ERROR_LENGTH = 200
+
+
+def serve_shard(conn, shm_name, slot):
+    """
+    The worker loop of one PartitionedFibHeap shard.
+
+    It owns a FibHeap, applies the messages received on conn, and after every message
+    writes its current minimum priority (inf when empty) to its slot of the shared
+    minima array before replying. Each reply is (error, result, node_count); the
+    result of a batch is (failure count, the first MAX_BATCH_ERRORS messages).
+
+    Args:
+        conn (Connection): The worker's end of the pipe to the coordinator.
+        shm_name (str): The name of the shared-memory block holding the minima.
+        slot (int): This shard's index in the minima array.
+    """
+    shm = shared_memory.SharedMemory(name=shm_name)
+    minima = shm.buf.cast("d")
+    heap = FibHeap()
+    try:
+        while True:
+            message = conn.recv()
+            if message is None:
+                break
+            op, payload = message
+            error = result = None
+            try:
+                if op == "batch":
+                    # per-command errors are counted so one bad entry doesn't drop the batch
+                    failures = 0
+                    messages = []
+                    for command, key, priority in payload:
+                        try:
+                            if command == "insert":
+                                heap.insert(key, priority)
+                            elif command == "decrease":
+                                heap.decrease_key(key, priority)
+                            else:
+                                heap.update(key, priority)
+                        except ValueError as exc:
+                            failures += 1
+                            if len(messages) < MAX_BATCH_ERRORS:
+                                messages.append(str(exc)[:ERROR_LENGTH])
+                    result = (failures, messages)
+                elif op == "extract":
+                    node = heap.extractMin()
+                    result = (node.key, node.priority)
+                elif op == "delete":
+                    node = heap.delete(payload)
+                    result = (node.key, node.priority)
+                elif op == "peek":
+                    node = heap.getMin()
+                    result = None if node is None else (node.key, node.priority)
+                elif op == "priority":
+                    result = heap.priority_of(payload)
+                else:
+                    error = f"unknown message '{op}'"
+            except ValueError as exc:
+                error = str(exc)
+            top = heap.mMinimum
+            minima[slot] = infinity if top is None else top.priority
+            conn.send((error, result, heap.node_count))
+    finally:
+        minima.release()
+        shm.close()
+        conn.close()
+
+
+class PartitionedFibHeap:
+    """
+        A priority queue partitioned by key hash across worker processes.
+
+        Each worker process owns the FibHeap of one shard. Inserts, decreases and
+        updates are buffered per shard and sent in batches over a pipe; a batch is sent
+        once it holds batch_size commands, or when an operation needs the heap to be
+        current (sync). Workers publish their minimum priority in a shared-memory array
+        of doubles, so extractMin reads every shard's minimum from memory and then talks
+        to the single shard that holds the global minimum.
+
+        Keys and priorities cross process boundaries, so keys must be picklable. Use
+        the heap as a context manager, or call close(), to stop the workers and free
+        the shared memory.
+
+        Attributes:
+            shard_count (int): The number of worker processes.
+            batch_size (int): Buffered commands per shard that trigger a send.
+            minima (memoryview): The shared minimum priority of every shard.
+            conns (list): The coordinator's end of each worker's pipe.
+            workers (list): The worker processes.
+            pending (list): Unsent (command, key, priority) tuples per shard.
+            outstanding (list): Batches sent but not yet acknowledged, per shard.
+            counts (list): The node count each shard last reported.
+            errors (list): The first batch errors received but not yet raised by sync.
+            failures (int): The number of failed batched commands not yet raised.
+    """
+    checkKey = FibHeap.checkKey
+    checkPriority = FibHeap.checkPriority
+    MAX_OUTSTANDING = 64
+
+    def __init__(self, shard_count=None, batch_size=1024, context=None):
+        """
+        Args:
+            shard_count (int): The number of worker processes; defaults to the CPU count.
+            batch_size (int): Buffered commands per shard that trigger a send.
+            context: A multiprocessing context; defaults to multiprocessing's default.
+
+        Raises:
+            ValueError: If shard_count or batch_size is smaller than 1.
+        """
+        if shard_count is None:
+            shard_count = multiprocessing.cpu_count()
+        if shard_count < 1:
+            raise ValueError(f"shard_count must be at least 1, got {shard_count}.")
+        if batch_size < 1:
+            raise ValueError(f"batch_size must be at least 1, got {batch_size}.")
+        context = context or multiprocessing.get_context()
+        self.shard_count = shard_count
+        self.batch_size = batch_size
+        self.shm = shared_memory.SharedMemory(create=True, size=8 * shard_count)
+        self.minima = self.shm.buf.cast("d")
+        for slot in range(shard_count):
+            self.minima[slot] = infinity
+        self.conns = []
+        self.workers = []
+        for slot in range(shard_count):
+            parent, child = context.Pipe()
+            worker = context.Process(target=serve_shard, args=(child, self.shm.name, slot), daemon=True)
+            worker.start()
+            child.close()
+            self.conns.append(parent)
+            self.workers.append(worker)
+        self.pending = [[] for _ in range(shard_count)]
+        self.outstanding = [0] * shard_count
+        self.counts = [0] * shard_count
+        self.errors = []
+        self.failures = 0
+
+
+    def shard_of(self, key):
+        """
+        Returns:
+            int: The index of the shard that holds (or would hold) key.
+        """
+        return hash(key) % self.shard_count
+
+
+    def enqueue(self, command, key, priority):
+        """
+        Buffers one command for key's shard and sends the buffer once it is full.
+        """
+        self.checkKey(key)
+        priority = self.checkPriority(priority)
+        i = self.shard_of(key)
+        pending = self.pending[i]
+        pending.append((command, key, priority))
+        if len(pending) >= self.batch_size:
+            self.send_batch(i)
+
+
+    def send_batch(self, i):
+        """
+        Sends shard i's buffered commands as one message, without waiting for the reply.
+
+        At most MAX_OUTSTANDING batches stay unacknowledged per shard, so unread
+        replies never fill the pipe and block the worker.
+        """
+        if self.outstanding[i] >= self.MAX_OUTSTANDING:
+            self.receive_ack(i)
+        self.conns[i].send(("batch", self.pending[i]))
+        self.pending[i] = []
+        self.outstanding[i] += 1
+
+
+    def receive_ack(self, i):
+        """
+        Receives the reply to shard i's oldest outstanding batch and keeps its errors.
+        """
+        error, result, self.counts[i] = self.conns[i].recv()
+        self.outstanding[i] -= 1
+        failures, messages = (1, [error]) if error is not None else result
+        self.failures += failures
+        # only the first few messages are kept; the rest are counted
+        self.errors.extend(messages[:MAX_BATCH_ERRORS - len(self.errors)])
+
+
+    def sync(self):
+        """
+        Sends every buffered command and waits for all outstanding batches.
+
+        After sync, the shared minima and counts reflect every command issued so far.
+
+        Raises:
+            ValueError: If any batched command failed (e.g. a duplicate key); the other
+                commands are still applied. The message holds the number of failures
+                and the first few of their messages.
+        """
+        for i in range(self.shard_count):
+            if self.pending[i]:
+                self.send_batch(i)
+        for i in range(self.shard_count):
+            while self.outstanding[i]:
+                self.receive_ack(i)
+        if self.errors or self.failures:
+            errors, failures = self.errors, self.failures
+            self.errors, self.failures = [], 0
+            if failures > len(errors):
+                errors.append(f"{failures - len(errors)} more command(s) failed")
+            raise ValueError("; ".join(errors))
+
+
+    def request(self, i, op, payload=None):
+        """
+        Sends one message to shard i and returns the result of its reply.
+
+        Raises:
+            ValueError: If the worker reported an error.
+        """
+        conn = self.conns[i]
+        conn.send((op, payload))
+        error, result, self.counts[i] = conn.recv()
+        if error is not None:
+            raise ValueError(error)
+        return result
+
+
+    def insert(self, key, priority):
+        """
+        Queues the insertion of key with priority.
+
+        Key and priority are validated immediately; a duplicate key is reported by the
+        next sync (or by any operation that syncs).
+        """
+        self.enqueue("insert", key, priority)
+
+
+    def decrease_key(self, key, priority):
+        """
+        Queues a decrease of key's priority; larger priorities are ignored.
+        """
+        self.enqueue("decrease", key, priority)
+
+
+    def update(self, key, priority):
+        """
+        Queues setting key's priority, inserting the key if needed.
+        """
+        self.enqueue("update", key, priority)
+
+
+    def min_shard(self):
+        """
+        Returns the shard with the smallest published minimum, or None if all are empty.
+        """
+        minima = self.minima
+        best = None
+        for i in range(self.shard_count):
+            if minima[i] < infinity and (best is None or minima[i] < minima[best]):
+                best = i
+        return best
+
+
+    def getMin(self):
+        """
+        Returns:
+            tuple: The (key, priority) with the smallest priority, or None if empty.
+        """
+        self.sync()
+        i = self.min_shard()
+        return None if i is None else self.request(i, "peek")
+
+
+    def min_priority(self):
+        """
+        Returns the smallest priority in the heap, or inf if it is empty, read from
+        shared memory after a sync.
+        """
+        self.sync()
+        i = self.min_shard()
+        return infinity if i is None else self.minima[i]
+
+
+    def extractMin(self):
+        """
+        Removes the global minimum; only the shard holding it is contacted.
+
+        Raises:
+            ValueError: If the heap is empty.
+
+        Returns:
+            tuple: The removed (key, priority).
+        """
+        self.sync()
+        i = self.min_shard()
+        if i is None:
+            raise ValueError("Empty Heap")
+        return self.request(i, "extract")
+
+
+    def delete(self, key):
+        """
+        Removes key.
+
+        Raises:
+            ValueError: If the key is not in the heap.
+
+        Returns:
+            tuple: The removed (key, priority).
+        """
+        self.sync()
+        return self.request(self.shard_of(key), "delete", key)
+
+
+    def priority_of(self, key):
+        """
+        Returns the priority stored under key.
+
+        Raises:
+            ValueError: If the key is not in the heap.
+        """
+        self.sync()
+        return self.request(self.shard_of(key), "priority", key)
+
+
+    def __len__(self):
+        self.sync()
+        return sum(self.counts)
+
+
+    def isEmpty(self):
+        return len(self) == 0
+
+
+    def close(self, timeout=5.0):
+        """
+        Stops the workers and frees the shared memory. Buffered commands are dropped.
+
+        Args:
+            timeout (float): Seconds to wait for each worker to exit before it is
+                terminated.
+        """
+        if self.shm is None:
+            return
+        try:
+            for conn, worker in zip(self.conns, self.workers):
+                try:
+                    conn.send(None)
+                except (BrokenPipeError, OSError):
+                    pass
+                worker.join(timeout)
+                if worker.is_alive():
+                    worker.terminate()
+                    worker.join()
+                conn.close()
+        finally:
+            self.minima.release()
+            self.shm.close()
+            self.shm.unlink()
+            self.shm = None
+
+
+    def __enter__(self):
+        return self
+
+
+    def __exit__(self, *exc_info):
+        self.close()
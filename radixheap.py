@@ -0,0 +1,227 @@
+from fibonacciHeap import FibHeap
+from priorityqueue import MergeablePriorityQueue
+
+
+class RadixEntry:
+    """
+        A radix-heap entry.
+
+        Attributes:
+            key: The unique identifier of the entry.
+            priority (int): The integer priority.
+            bucket (int): The bucket currently holding the entry.
+            position (int): The entry's slot inside that bucket.
+    """
+    __slots__ = ("key", "priority", "bucket", "position")
+
+    def __init__(self, key, priority):
+        self.key = key
+        self.priority = priority
+        self.bucket = -1
+        self.position = -1
+
+    def __str__(self) -> str:
+        return f"Key: {self.key}, Priority: {self.priority}"
+
+
+class RadixHeap(MergeablePriorityQueue):
+    """
+        A radix heap for monotone integer priorities.
+
+        Priorities must be integers that never go below the last extracted minimum
+        (last), as in Dijkstra with integer weights or timer queues. An entry with
+        priority p lives in bucket (p XOR last).bit_length(), so bucket 0 holds entries
+        equal to last and an entry only ever moves to lower buckets. insert and
+        fib_decrease are O(1); extractMin is O(log C) amortized for priorities up to C,
+        with integer XORs instead of float comparisons across a forest.
+
+        Any call that would break monotonicity (a priority below last) raises
+        ValueError immediately.
+
+        Attributes:
+            buckets (list): The bucket lists; grown when a priority needs more bits.
+            last (int): The last extracted minimum (0 before the first extraction).
+            index (dict): Maps every key to its entry.
+            node_count (int): The number of entries.
+    """
+    handle_type = RadixEntry
+    checkKey = FibHeap.checkKey
+
+    def __init__(self):
+        self.buckets = [[] for _ in range(65)]
+        self.last = 0
+        self.index = {}
+        self.node_count = 0
+
+
+    def checkPriority(self, priority):
+        """
+        Validates an integer priority that respects monotonicity.
+
+        Integral floats such as 3.0 are accepted and converted.
+
+        Raises:
+            ValueError: If the priority is not an integer or is below last.
+
+        Returns:
+            int: The priority.
+        """
+        if isinstance(priority, float) and priority.is_integer():
+            priority = int(priority)
+        if not isinstance(priority, int):
+            raise ValueError(f"invalid priority value: {priority}. RadixHeap needs integer priorities.")
+        if priority < self.last:
+            raise ValueError(
+                f"priority {priority} is below the last extracted minimum {self.last}: "
+                "RadixHeap priorities must be monotone.")
+        return priority
+
+
+    def place(self, entry):
+        """
+        Appends entry to the bucket that matches its priority.
+        """
+        b = (entry.priority ^ self.last).bit_length()
+        if b >= len(self.buckets):
+            self.buckets.extend([] for _ in range(b + 1 - len(self.buckets)))
+        bucket = self.buckets[b]
+        entry.bucket = b
+        entry.position = len(bucket)
+        bucket.append(entry)
+
+
+    def unplace(self, entry):
+        """
+        Removes entry from its bucket by moving the bucket's last entry into its slot.
+        """
+        bucket = self.buckets[entry.bucket]
+        moved = bucket.pop()
+        if moved is not entry:
+            bucket[entry.position] = moved
+            moved.position = entry.position
+        entry.bucket = entry.position = -1
+
+
+    def insert(self, key, priority):
+        """
+        Inserts key with an integer priority no smaller than last.
+
+        Raises:
+            ValueError: If the key is invalid or already present, or the priority is
+                not an integer or breaks monotonicity.
+
+        Returns:
+            RadixEntry: The new entry.
+        """
+        self.checkKey(key)
+        if key in self.index:
+            raise ValueError(f"Duplicate key '{key}' is not allowed.")
+        entry = RadixEntry(key, self.checkPriority(priority))
+        self.place(entry)
+        self.index[key] = entry
+        self.node_count += 1
+        return entry
+
+
+    def isEmpty(self):
+        return self.node_count == 0
+
+
+    def getMin(self):
+        """
+        Returns:
+            RadixEntry: The entry with the smallest priority, or None if empty.
+        """
+        for bucket in self.buckets:
+            if bucket:
+                return min(bucket, key=lambda entry: entry.priority)
+        return None
+
+
+    def extractMin(self):
+        """
+        Removes the minimum entry.
+
+        When bucket 0 is empty, the first non-empty bucket is redistributed around its
+        minimum, which becomes the new last; every entry moves to a lower bucket.
+
+        Raises:
+            ValueError: If the heap is empty.
+
+        Returns:
+            RadixEntry: The removed entry.
+        """
+        if self.node_count == 0:
+            raise ValueError("Empty Heap")
+        buckets = self.buckets
+        if not buckets[0]:
+            b = 1
+            while not buckets[b]:
+                b += 1
+            bucket = buckets[b]
+            buckets[b] = []
+            self.last = min(entry.priority for entry in bucket)
+            for entry in bucket:
+                self.place(entry)
+        entry = buckets[0].pop()
+        entry.bucket = entry.position = -1
+        del self.index[entry.key]
+        self.node_count -= 1
+        return entry
+
+
+    def fib_decrease(self, x, priority):
+        """
+        Lowers the priority of entry x; larger priorities are ignored.
+
+        Raises:
+            ValueError: If the priority is not an integer or is below last.
+        """
+        priority = self.checkPriority(priority)
+        if priority > x.priority:
+            return
+        self.unplace(x)
+        x.priority = priority
+        self.place(x)
+
+
+    def delete(self, x):
+        """
+        Removes the entry x (or the entry stored under key x).
+
+        Raises:
+            ValueError: If x is not in the heap.
+
+        Returns:
+            RadixEntry: The removed entry.
+        """
+        entry = self.lookup(x)
+        self.unplace(entry)
+        del self.index[entry.key]
+        self.node_count -= 1
+        return entry
+
+
+    def fib_Union(self, other):
+        """
+        Moves every entry of other into this heap, re-bucketing them around this
+        heap's last. O(m) for m entries in other.
+
+        Raises:
+            ValueError: If the heaps share a key, or other holds a priority below this
+                heap's last.
+
+        Returns:
+            RadixHeap: This heap.
+        """
+        entries = [entry for bucket in other.buckets for entry in bucket]
+        if entries and min(entry.priority for entry in entries) < self.last:
+            raise ValueError(
+                f"Cannot union: the other heap holds priorities below the last extracted minimum {self.last}.")
+        self.merge_index(other)
+        for entry in entries:
+            self.place(entry)
+        self.node_count += other.node_count
+        other.buckets = [[] for _ in range(65)]
+        other.node_count = 0
+        return self
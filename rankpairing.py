@@ -0,0 +1,230 @@
+from fibonacciHeap import FibHeap
+from priorityqueue import MergeablePriorityQueue
+
+
+class RankPairingNode:
+    """
+        A rank-pairing heap entry, stored as a node of a half-ordered binary tree.
+
+        A node's priority is no larger than any priority in its left subtree; the right
+        subtree is unordered relative to it. A root has a left child only.
+
+        Attributes:
+            key: The unique identifier of the entry.
+            priority: The priority value used for ordering.
+            left: The left child, or None.
+            right: The right child, or None (always None for a root).
+            parent: The node this one is a child of, or None for a root.
+            rank: The node's rank, kept with the type-1 rank rule.
+    """
+    __slots__ = ("key", "priority", "left", "right", "parent", "rank")
+
+    def __init__(self, key, priority):
+        self.key = key
+        self.priority = priority
+        self.left = None
+        self.right = None
+        self.parent = None
+        self.rank = 0
+
+    def __str__(self) -> str:
+        return f"Key: {self.key}, Priority: {self.priority}"
+
+
+class RankPairingHeap(MergeablePriorityQueue):
+    """
+        A type-1 rank-pairing heap (Haeupler, Sen and Tarjan).
+
+        It has the same amortized bounds as a Fibonacci heap (O(1) insert, union and
+        decrease-key, O(log n) extract-min) but does no cascading cuts: decrease-key
+        cuts one half-tree and repairs ranks on the path above it, and extract-min
+        links each pair of equal-rank roots once (one-pass linking).
+
+        Attributes:
+            roots (list): The roots of the half-trees.
+            minimum (RankPairingNode): The root with the smallest priority, or None.
+            index (dict): Maps every key to its node.
+            node_count (int): The number of entries.
+    """
+    handle_type = RankPairingNode
+    checkKey = FibHeap.checkKey
+    checkPriority = FibHeap.checkPriority
+
+    def __init__(self):
+        self.roots = []
+        self.minimum = None
+        self.index = {}
+        self.node_count = 0
+
+
+    def insert(self, key, priority):
+        """
+        Inserts key with priority as a new one-node half-tree.
+
+        Raises:
+            ValueError: If the key is invalid or already present, or the priority is invalid.
+
+        Returns:
+            RankPairingNode: The new node.
+        """
+        self.checkKey(key)
+        if key in self.index:
+            raise ValueError(f"Duplicate key '{key}' is not allowed.")
+        node = RankPairingNode(key, self.checkPriority(priority))
+        self.index[key] = node
+        self.roots.append(node)
+        if self.minimum is None or node.priority < self.minimum.priority:
+            self.minimum = node
+        self.node_count += 1
+        return node
+
+
+    def isEmpty(self):
+        return self.minimum is None
+
+
+    def getMin(self):
+        return self.minimum
+
+
+    def link(self, a, b):
+        """
+        Links two roots of equal rank; the loser becomes the winner's left child.
+
+        Returns:
+            RankPairingNode: The winner, whose rank grows by one.
+        """
+        if b.priority < a.priority:
+            a, b = b, a
+        b.right = a.left
+        if b.right is not None:
+            b.right.parent = b
+        a.left = b
+        b.parent = a
+        a.rank += 1
+        return a
+
+
+    def extractMin(self):
+        """
+        Removes the minimum root, turns its left spine into roots and links the roots
+        of equal rank in one pass.
+
+        Raises:
+            ValueError: If the heap is empty.
+
+        Returns:
+            RankPairingNode: The removed node.
+        """
+        x = self.minimum
+        if x is None:
+            raise ValueError("Empty Heap")
+        candidates = [root for root in self.roots if root is not x]
+
+        # the right spine of x's left subtree becomes new half-trees
+        y = x.left
+        while y is not None:
+            following = y.right
+            y.right = y.parent = None
+            y.rank = y.left.rank + 1 if y.left is not None else 0
+            candidates.append(y)
+            y = following
+        x.left = None
+
+        buckets = {}
+        roots = []
+        for root in candidates:
+            other = buckets.pop(root.rank, None)
+            if other is None:
+                buckets[root.rank] = root
+            else:
+                roots.append(self.link(root, other))
+        roots.extend(buckets.values())
+
+        self.roots = roots
+        self.minimum = min(roots, key=lambda root: root.priority) if roots else None
+        del self.index[x.key]
+        self.node_count -= 1
+        return x
+
+
+    def cut(self, x):
+        """
+        Detaches the non-root x with its left subtree, makes it a root, and restores
+        the type-1 rank rule on the path above it.
+        """
+        y = x.parent
+        z = x.right
+        if y.left is x:
+            y.left = z
+        else:
+            y.right = z
+        if z is not None:
+            z.parent = y
+        x.right = x.parent = None
+        x.rank = x.left.rank + 1 if x.left is not None else 0
+        self.roots.append(x)
+
+        u = y
+        while u is not None:
+            if u.parent is None:
+                rank = u.left.rank + 1 if u.left is not None else 0
+            else:
+                r1 = u.left.rank if u.left is not None else -1
+                r2 = u.right.rank if u.right is not None else -1
+                rank = max(r1, r2) if abs(r1 - r2) > 1 else max(r1, r2) + 1
+            if rank >= u.rank:
+                break
+            u.rank = rank
+            u = u.parent
+
+
+    def fib_decrease(self, x, priority):
+        """
+        Lowers the priority of x; larger priorities are ignored.
+        """
+        if priority > x.priority:
+            return
+        x.priority = priority
+        if x.parent is not None:
+            self.cut(x)
+        if priority < self.minimum.priority:
+            self.minimum = x
+
+
+    def delete(self, x):
+        """
+        Removes the node x (or the node stored under key x).
+
+        Raises:
+            ValueError: If x is not in the heap.
+
+        Returns:
+            RankPairingNode: The removed node.
+        """
+        node = self.lookup(x)
+        if node.parent is not None:
+            self.cut(node)
+        self.minimum = node
+        return self.extractMin()
+
+
+    def fib_Union(self, other):
+        """
+        Concatenates the root lists of the two heaps.
+
+        Raises:
+            ValueError: If the heaps share a key.
+
+        Returns:
+            RankPairingHeap: This heap.
+        """
+        self.merge_index(other)
+        self.roots.extend(other.roots)
+        if other.minimum is not None and (self.minimum is None or other.minimum.priority < self.minimum.priority):
+            self.minimum = other.minimum
+        self.node_count += other.node_count
+        other.roots = []
+        other.minimum = None
+        other.node_count = 0
+        return self
@@ -0,0 +1,64 @@
+class OwnerToken:
+    """
+        Identifies the heap that currently owns a group of nodes.
+
+        Tokens form a union-find forest: when a heap is merged into another, its token
+        is pointed at the surviving heap's token instead of touching every node, and
+        owner lookups follow (and compress) the parent chain.
+
+        Attributes:
+            parent: The token this one was merged into, or None for a live heap's token.
+    """
+    __slots__ = ("parent",)
+
+    def __init__(self):
+        self.parent = None
+
+    def find(self):
+        """
+        Returns:
+            OwnerToken: The root token, i.e. the token of the heap that owns this group.
+        """
+        root = self
+        while root.parent is not None:
+            root = root.parent
+        # path compression keeps later lookups close to O(1)
+        token = self
+        while token.parent is not None and token.parent is not root:
+            token.parent, token = root, token.parent
+        return root
+
+
+class KeyRegistry:
+    """
+        A key index shared by a family of heaps, such as the shards of one queue.
+
+        Every heap created from the same registry stores its nodes in the registry's
+        index, so keys are unique across the whole family and fib_Union between two of
+        its heaps does not need to check or move any keys: it is O(1). Membership of a
+        key in one particular heap is resolved through the node's owner token.
+
+        Attributes:
+            index (dict): Maps every key in the family to its Node.
+    """
+    def __init__(self):
+        self.index = {}
+
+    def new_heap(self, metrics=None):
+        """
+        Creates an empty heap that shares this registry's key index.
+
+        Args:
+            metrics (HeapMetrics): Optional instrumentation for the new heap.
+
+        Returns:
+            FibHeap: The new heap.
+        """
+        from fibonacciHeap import FibHeap
+        return FibHeap(metrics=metrics, registry=self)
+
+    def __len__(self):
+        return len(self.index)
+
+    def __contains__(self, key):
+        return key in self.index
@@ -0,0 +1,221 @@
+import os
+import random
+import threading
+
+from fibonacciHeap import FibHeap
+
+
+class ShardedFibHeap:
+    """
+        A thread-safe priority queue spread across N FibHeap shards.
+
+        Each key lives in shard hash(key) % N, so the shard of a key is computed, not
+        looked up, and threads that touch different shards never share a lock. insert,
+        decrease_key, update and delete lock only the key's shard.
+
+        Two extract operations are offered:
+
+            - extractMin is strict: it locks every shard in order and removes the global
+              minimum. It is linearizable but serializes with all other operations.
+            - extract_relaxed follows the MultiQueue scheme: it samples two shards, locks
+              the one whose minimum is smaller, and removes that minimum. The result is
+              usually among the smallest N entries, and concurrent consumers rarely
+              contend for the same lock.
+
+        Node handles are not returned: a handle is only safe to use while its shard's
+        lock is held, so every operation here is keyed.
+
+        Attributes:
+            shards (list): The FibHeap shards.
+            locks (list): One threading.Lock per shard.
+            local (threading.local): Per-thread random generators for extract_relaxed.
+    """
+
+    def __init__(self, shard_count=None, metrics=None):
+        """
+        Args:
+            shard_count (int): The number of shards; defaults to twice the CPU count,
+                the usual MultiQueue setting.
+            metrics (HeapMetrics): Optional instrumentation, shared by every shard. Its
+                counters are not atomic, so counts are approximate under contention.
+
+        Raises:
+            ValueError: If shard_count is smaller than 1.
+        """
+        if shard_count is None:
+            shard_count = 2 * (os.cpu_count() or 1)
+        if shard_count < 1:
+            raise ValueError(f"shard_count must be at least 1, got {shard_count}.")
+        self.shards = [FibHeap(metrics=metrics) for _ in range(shard_count)]
+        self.locks = [threading.Lock() for _ in range(shard_count)]
+        self.local = threading.local()
+
+
+    def shard_of(self, key):
+        """
+        Returns:
+            int: The index of the shard that holds (or would hold) key.
+        """
+        return hash(key) % len(self.shards)
+
+
+    def insert(self, key, priority):
+        """
+        Inserts key with priority into its shard.
+
+        Raises:
+            ValueError: If the key is invalid or already present, or the priority is invalid.
+        """
+        i = self.shard_of(key)
+        with self.locks[i]:
+            self.shards[i].insert(key, priority)
+
+
+    def decrease_key(self, key, priority):
+        """
+        Decreases the priority stored under key; larger priorities are ignored.
+
+        Raises:
+            ValueError: If the key is not in the heap or the priority is invalid.
+        """
+        i = self.shard_of(key)
+        with self.locks[i]:
+            self.shards[i].decrease_key(key, priority)
+
+
+    def update(self, key, priority):
+        """
+        Sets the priority of key, inserting it if needed.
+        """
+        i = self.shard_of(key)
+        with self.locks[i]:
+            self.shards[i].update(key, priority)
+
+
+    def delete(self, key):
+        """
+        Removes key.
+
+        Raises:
+            ValueError: If the key is not in the heap.
+
+        Returns:
+            tuple: The removed (key, priority).
+        """
+        i = self.shard_of(key)
+        with self.locks[i]:
+            node = self.shards[i].delete(key)
+        return node.key, node.priority
+
+
+    def priority_of(self, key):
+        """
+        Returns the priority stored under key.
+
+        Raises:
+            ValueError: If the key is not in the heap.
+        """
+        i = self.shard_of(key)
+        with self.locks[i]:
+            return self.shards[i].priority_of(key)
+
+
+    def __contains__(self, key):
+        i = self.shard_of(key)
+        with self.locks[i]:
+            return key in self.shards[i]
+
+
+    def __len__(self):
+        # each count is read atomically; the sum is a snapshot, not a linearized size
+        return sum(shard.node_count for shard in self.shards)
+
+
+    def isEmpty(self):
+        return len(self) == 0
+
+
+    def getMin(self):
+        """
+        Returns:
+            tuple: The (key, priority) with the smallest priority, or None if empty.
+        """
+        for lock in self.locks:
+            lock.acquire()
+        try:
+            best = self.strict_minimum()
+            return None if best is None else (best.mMinimum.key, best.mMinimum.priority)
+        finally:
+            for lock in self.locks:
+                lock.release()
+
+
+    def strict_minimum(self):
+        """
+        Returns the shard holding the global minimum, or None if every shard is empty.
+        The caller must hold every shard lock.
+        """
+        best = None
+        for shard in self.shards:
+            top = shard.mMinimum
+            if top is not None and (best is None or top.priority < best.mMinimum.priority):
+                best = shard
+        return best
+
+
+    def extractMin(self):
+        """
+        Removes the global minimum with every shard locked.
+
+        Raises:
+            ValueError: If the heap is empty.
+
+        Returns:
+            tuple: The removed (key, priority).
+        """
+        for lock in self.locks:
+            lock.acquire()
+        try:
+            best = self.strict_minimum()
+            if best is None:
+                raise ValueError("Empty Heap")
+            node = best.extractMin()
+        finally:
+            for lock in self.locks:
+                lock.release()
+        return node.key, node.priority
+
+
+    def extract_relaxed(self):
+        """
+        Removes the smaller minimum of two randomly sampled shards (MultiQueue).
+
+        The two minima are compared without locks. The chosen shard is then locked and
+        its current minimum removed; if it was emptied in the meantime, the sample is
+        retried, and after a few misses the call falls back to extractMin.
+
+        Raises:
+            ValueError: If the heap is empty.
+
+        Returns:
+            tuple: The removed (key, priority).
+        """
+        rng = getattr(self.local, "rng", None)
+        if rng is None:
+            rng = self.local.rng = random.Random()
+        shards, locks = self.shards, self.locks
+        n = len(shards)
+        for _ in range(4):
+            i = rng.randrange(n)
+            j = rng.randrange(n)
+            a, b = shards[i].mMinimum, shards[j].mMinimum
+            if a is None or (b is not None and b.priority < a.priority):
+                i, a = j, b
+            if a is None:
+                continue
+            with locks[i]:
+                if shards[i].mMinimum is not None:
+                    node = shards[i].extractMin()
+                    return node.key, node.priority
+        # the samples kept hitting empty shards
+        return self.extractMin()
@@ -0,0 +1,201 @@
+import math
+from array import array
+from fibonacciHeap import FibHeap
+
+NO_VERTEX = -1  # predecessor of a source or an unreached vertex
+
+
+class CSRGraph:
+    """
+        A weighted directed graph in compressed sparse row form.
+
+        The out-edges of vertex u are indices[indptr[u]:indptr[u + 1]], with matching
+        weights in weights[...]. All three are typed arrays, so a graph costs 24 bytes
+        per edge plus 8 bytes per vertex, with no per-vertex Python lists or dicts.
+
+        Args:
+            indptr (array('q')): Row offsets, of length vertex_count + 1.
+            indices (array('q')): Edge targets.
+            weights (array('d')): Edge weights, all non-negative.
+
+        Attributes:
+            vertex_count (int): The number of vertices, numbered 0..vertex_count-1.
+            edge_count (int): The number of directed edges.
+    """
+    def __init__(self, indptr, indices, weights):
+        if len(indices) != len(weights) or len(indptr) == 0 or indptr[-1] != len(indices):
+            raise ValueError("indptr, indices and weights do not describe the same edges")
+        self.indptr = indptr
+        self.indices = indices
+        self.weights = weights
+        self.vertex_count = len(indptr) - 1
+        self.edge_count = len(indices)
+
+
+    @classmethod
+    def from_edges(cls, vertex_count, edges, directed=True):
+        """
+        Builds a CSR graph from (u, v, weight) triples with a counting sort by source.
+
+        Args:
+            vertex_count (int): The number of vertices.
+            edges: An iterable of (u, v, weight) triples.
+            directed (bool): When False, every edge is also added in reverse.
+
+        Raises:
+            ValueError: If a vertex is out of range or a weight is negative or NaN.
+
+        Returns:
+            CSRGraph: The graph.
+        """
+        sources = array("q")
+        targets = array("q")
+        costs = array("d")
+        for u, v, weight in edges:
+            if not (0 <= u < vertex_count and 0 <= v < vertex_count):
+                raise ValueError(f"edge ({u}, {v}) has a vertex outside 0..{vertex_count - 1}")
+            weight = float(weight)
+            if not weight >= 0:
+                raise ValueError(f"edge ({u}, {v}) has invalid weight {weight}: must be >= 0")
+            sources.append(u)
+            targets.append(v)
+            costs.append(weight)
+            if not directed:
+                sources.append(v)
+                targets.append(u)
+                costs.append(weight)
+
+        indptr = array("q", bytes(8 * (vertex_count + 1)))
+        for u in sources:
+            indptr[u + 1] += 1
+        for u in range(vertex_count):
+            indptr[u + 1] += indptr[u]
+
+        fill = array("q", indptr[:-1])
+        indices = array("q", bytes(8 * len(sources)))
+        weights = array("d", bytes(8 * len(sources)))
+        for u, v, weight in zip(sources, targets, costs):
+            slot = fill[u]
+            indices[slot] = v
+            weights[slot] = weight
+            fill[u] = slot + 1
+        return cls(indptr, indices, weights)
+
+
+    def neighbors(self, u):
+        """
+        Returns:
+            list: The (v, weight) pairs of the out-edges of u.
+        """
+        start, end = self.indptr[u], self.indptr[u + 1]
+        return list(zip(self.indices[start:end], self.weights[start:end]))
+
+
+def dijkstra(graph, sources, target=None):
+    """
+    Runs Dijkstra's algorithm on a CSRGraph with a FibHeap and decrease-key.
+
+    Args:
+        graph (CSRGraph): The graph.
+        sources: A source vertex, or an iterable of source vertices (multi-source
+            search: every source starts at distance 0).
+        target (int): When given, the search stops as soon as target is settled, so
+            only vertices closer than target have final distances.
+
+    Returns:
+        tuple: (dist, pred) arrays indexed by vertex. dist is array('d') with inf for
+            unreached vertices; pred is array('q') with NO_VERTEX for sources and
+            unreached vertices.
+    """
+    return search(graph, sources, target, None)
+
+
+def astar(graph, source, target, heuristic):
+    """
+    Runs A* from source to target on a CSRGraph.
+
+    Args:
+        graph (CSRGraph): The graph.
+        source (int): The start vertex.
+        target (int): The goal vertex.
+        heuristic: A callable h(v) returning a lower bound on the distance from v to
+            target. A consistent heuristic settles each vertex once; an admissible but
+            inconsistent one may reopen vertices and still returns the shortest path.
+
+    Returns:
+        tuple: (dist, pred) arrays as for dijkstra; dist[target] is the path length.
+    """
+    return search(graph, source, target, heuristic)
+
+
+def search(graph, sources, target, heuristic):
+    """
+    The shared best-first search behind dijkstra and astar.
+
+    Each vertex is a FibHeap key; the node returned by insert is kept in a list
+    indexed by vertex, so relaxations call fib_decrease without any key lookup.
+
+    Args:
+        graph (CSRGraph): The graph.
+        sources: A source vertex or an iterable of them.
+        target (int): Optional early-exit vertex.
+        heuristic: Optional A* heuristic; None runs plain Dijkstra.
+
+    Returns:
+        tuple: The (dist, pred) arrays.
+    """
+    n = graph.vertex_count
+    indptr, indices, weights = graph.indptr, graph.indices, graph.weights
+    dist = array("d", [math.inf]) * n
+    pred = array("q", [NO_VERTEX]) * n
+    handles = [None] * n
+    heap = FibHeap()
+
+    if isinstance(sources, int):
+        sources = (sources,)
+    for s in sources:
+        if not 0 <= s < n:
+            raise ValueError(f"source {s} is outside 0..{n - 1}")
+        if handles[s] is None:
+            dist[s] = 0.0
+            handles[s] = heap.insert(s, heuristic(s) if heuristic else 0.0)
+
+    while not heap.isEmpty():
+        node = heap.extractMin()
+        u = node.key
+        handles[u] = None
+        if u == target:
+            break
+        du = dist[u]
+        for slot in range(indptr[u], indptr[u + 1]):
+            v = indices[slot]
+            candidate = du + weights[slot]
+            if candidate < dist[v]:
+                dist[v] = candidate
+                pred[v] = u
+                priority = candidate + heuristic(v) if heuristic else candidate
+                handle = handles[v]
+                if handle is None:
+                    handles[v] = heap.insert(v, priority)
+                else:
+                    heap.fib_decrease(handle, priority)
+    return dist, pred
+
+
+def path(pred, target):
+    """
+    Reads the path to target out of a predecessor array.
+
+    Args:
+        pred (array): The predecessor array returned by dijkstra or astar.
+        target (int): The end vertex.
+
+    Returns:
+        list: The vertices from the source to target, or [target] if target is a source
+            (or was never reached; check dist[target] to tell these apart).
+    """
+    vertices = [target]
+    while pred[vertices[-1]] != NO_VERTEX:
+        vertices.append(pred[vertices[-1]])
+    vertices.reverse()
+    return vertices
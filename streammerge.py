@@ -0,0 +1,283 @@
+from bisect import bisect_right
+from itertools import islice
+
+from fibonacciHeap import FibHeap
+
+
+class SortKeyHeap(FibHeap):
+    """
+        A FibHeap that keeps priorities exactly as given instead of converting them
+        to floats, so any mutually comparable sort keys work: ints beyond 2**53,
+        strings, tuples. Only None and values unequal to themselves (NaN) are rejected.
+    """
+
+    def checkPriority(self, priority):
+        if priority is None:
+            raise ValueError("priority cannot be None")
+        if priority != priority:
+            raise ValueError(f"{priority} is invalid: cannot be NaN.")
+        return priority
+
+
+    def checkPriorities(self, priorities):
+        """
+        Validates a batch of priorities in input order.
+
+        Raises:
+            ValueError: If any priority is None or NaN.
+
+        Returns:
+            list: The priorities, unchanged.
+        """
+        values = list(priorities)
+        for value in values:
+            if value is None or value != value:
+                self.checkPriority(value)
+        return values
+
+
+class MergeStream:
+    """
+        One input of a StreamMerger.
+
+        Attributes:
+            stream_id (int): The stream's key in the merger's heap.
+            iterator: The unread input.
+            buffer (list): The last pulled chunk of items.
+            priorities (list): The sort keys of buffer, as given.
+            position (int): The index of the stream's head item in buffer.
+            end (int): The end of the run of buffered items that may be emitted before
+                another stream has to be looked at.
+    """
+    __slots__ = ("stream_id", "iterator", "buffer", "priorities", "position", "end")
+
+    def __init__(self, stream_id, iterator):
+        self.stream_id = stream_id
+        self.iterator = iterator
+        self.buffer = []
+        self.priorities = []
+        self.position = 0
+        self.end = 0
+
+
+class StreamMerger:
+    """
+        An iterator that lazily merges sorted streams into one sorted stream.
+
+        The heap holds one entry per stream, keyed by stream id, whose priority is the
+        priority of the stream's head item, so memory is O(k * chunk_size) for k
+        streams. The stream taken from the heap emits a whole run straight from its
+        buffer: every buffered item up to the next-best head, found with one bisect.
+        Long runs therefore cost no heap work per item; a stream goes back into the
+        heap with an O(1) insert only when its run ends.
+
+        Unlike heapq.merge, streams can be added and removed while the merge runs. An
+        added stream takes part from its first item on: if that item is smaller than
+        something already returned, the output is sorted again from there.
+
+        Priorities are compared as given, so any mutually comparable sort keys work,
+        like with heapq.merge. Ties between streams come out in no particular order.
+
+        Attributes:
+            key: Maps an item to its priority; None uses the item itself.
+            chunk_size (int): The number of items pulled from a stream at a time.
+            heap (SortKeyHeap): The stream ids waiting for their turn, by head priority.
+            streams (dict): The MergeStreams with items left, by stream id.
+            current (MergeStream): The stream emitting its run, or None.
+            next_id (int): The id given to the next added stream.
+    """
+
+    def __init__(self, iterables=(), key=None, chunk_size=64):
+        """
+        Args:
+            iterables: The sorted inputs to start with.
+            key: Maps an item to its priority; None uses the item itself.
+            chunk_size (int): The number of items pulled from a stream at a time.
+
+        Raises:
+            ValueError: If chunk_size is smaller than 1, or a pulled item has an invalid
+                priority.
+        """
+        if chunk_size < 1:
+            raise ValueError(f"chunk_size must be at least 1, got {chunk_size}.")
+        self.key = key
+        self.chunk_size = chunk_size
+        self.heap = SortKeyHeap()
+        self.streams = {}
+        self.current = None
+        self.next_id = 0
+        heads = []
+        for iterable in iterables:
+            stream = self.open(iterable)
+            if stream is not None:
+                heads.append((stream.stream_id, stream.priorities[0]))
+        self.heap.insert_many(heads)
+
+
+    def open(self, iterable):
+        """
+        Registers a stream and pulls its first chunk.
+
+        Returns:
+            MergeStream: The new stream, or None if it is empty.
+        """
+        stream = MergeStream(self.next_id, iter(iterable))
+        self.next_id += 1
+        self.streams[stream.stream_id] = stream
+        if not self.refill(stream):
+            del self.streams[stream.stream_id]
+            return None
+        return stream
+
+
+    def refill(self, stream):
+        """
+        Replaces the stream's buffer with its next chunk.
+
+        Raises:
+            ValueError: If a pulled item has an invalid priority; the stream is removed.
+
+        Returns:
+            bool: False if the stream is exhausted.
+        """
+        chunk = list(islice(stream.iterator, self.chunk_size))
+        try:
+            priorities = self.heap.checkPriorities(chunk if self.key is None else map(self.key, chunk))
+        except ValueError:
+            self.remove(stream.stream_id)
+            raise
+        stream.buffer = chunk
+        stream.priorities = priorities
+        stream.position = stream.end = 0
+        return bool(chunk)
+
+
+    def add(self, iterable):
+        """
+        Adds a sorted stream to the merge in O(1) plus the pull of its first chunk.
+
+        Raises:
+            ValueError: If an item of the first chunk has an invalid priority.
+
+        Returns:
+            int: The id of the stream, for remove, or None if the stream was empty.
+        """
+        stream = self.open(iterable)
+        if stream is None:
+            return None
+        priority = stream.priorities[0]
+        self.heap.insert(stream.stream_id, priority)
+        current = self.current
+        if current is not None:
+            # the run in progress stops where the new head comes first
+            current.end = bisect_right(current.priorities, priority, current.position, current.end)
+        return stream.stream_id
+
+
+    def remove(self, stream_id):
+        """
+        Drops a stream from the merge, with any items it has buffered. The heap entry
+        is discarded in O(1); the stream's iterator is not closed.
+
+        Returns:
+            bool: True if the stream still had items.
+        """
+        stream = self.streams.pop(stream_id, None)
+        if stream is None:
+            return False
+        if stream is self.current:
+            self.current = None
+        else:
+            self.heap.discard(stream_id)
+        return True
+
+
+    def start_run(self, stream):
+        """
+        Makes stream the current one and sets the end of its run: the buffered items
+        no larger than the smallest head left in the heap.
+        """
+        top = self.heap.mMinimum
+        if top is None:
+            stream.end = len(stream.priorities)
+        else:
+            stream.end = bisect_right(stream.priorities, top.priority, stream.position)
+        self.current = stream
+
+
+    def advance(self):
+        """
+        Ends the current run and starts the next one.
+
+        Raises:
+            StopIteration: If every stream is exhausted.
+        """
+        stream = self.current
+        if stream is not None:
+            self.current = None
+            if stream.position < len(stream.buffer) or self.refill(stream):
+                top = self.heap.mMinimum
+                head = stream.priorities[stream.position]
+                if top is None or head <= top.priority:
+                    self.start_run(stream)
+                    return
+                self.heap.insert(stream.stream_id, head)
+            else:
+                del self.streams[stream.stream_id]
+        if self.heap.isEmpty():
+            raise StopIteration
+        self.start_run(self.streams[self.heap.extractMin().key])
+
+
+    def __len__(self):
+        """
+        Returns:
+            int: The number of streams with items left.
+        """
+        return len(self.streams)
+
+
+    def __iter__(self):
+        return self
+
+
+    def __next__(self):
+        """
+        Returns:
+            The next item in priority order.
+
+        Raises:
+            StopIteration: If every stream is exhausted.
+            ValueError: If a pulled item has an invalid priority; its stream is removed
+                from the merge.
+        """
+        stream = self.current
+        if stream is None or stream.position == stream.end:
+            self.advance()
+            stream = self.current
+        item = stream.buffer[stream.position]
+        stream.position += 1
+        return item
+
+
+def merge_streams(*iterables, key=None, chunk_size=64):
+    """
+    Lazily merges sorted iterables into one sorted iterator, like heapq.merge.
+
+    The result is a StreamMerger, so streams can also be added to or removed from it
+    while it is being consumed.
+
+    Args:
+        *iterables: Inputs sorted by key.
+        key: Maps an item to its sort key; None uses the item itself.
+        chunk_size (int): The number of items pulled from a stream at a time; larger
+            chunks make longer runs and less per-item overhead, at the cost of
+            O(k * chunk_size) memory.
+
+    Raises:
+        ValueError: If chunk_size is smaller than 1 or a priority is invalid.
+
+    Returns:
+        StreamMerger: An iterator over the merged items.
+    """
+    return StreamMerger(iterables, key, chunk_size)
@@ -0,0 +1,27 @@
+import asyncio
+
+import pytest
+
+from asyncqueue import AsyncFibQueue
+
+
+def test_failed_put_does_not_strand_the_next_putter():
+    async def scenario():
+        queue = AsyncFibQueue(maxsize=2)
+        await queue.put("Q", 1)
+        await queue.put("R", 2)
+        duplicate = asyncio.create_task(queue.put("R", 3))
+        invalid = asyncio.create_task(queue.put("X", float("nan")))
+        waiting = asyncio.create_task(queue.put("S", 4))
+        await asyncio.sleep(0)
+
+        assert await queue.get() == ("Q", 1.0)
+        with pytest.raises(ValueError):
+            await asyncio.wait_for(duplicate, 1)
+        with pytest.raises(ValueError):
+            await asyncio.wait_for(invalid, 1)
+        await asyncio.wait_for(waiting, 1)
+        assert queue.qsize() == 2
+        assert await queue.get_batch(2) == [("R", 2.0), ("S", 4.0)]
+
+    asyncio.run(scenario())
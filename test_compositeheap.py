@@ -0,0 +1,40 @@
+import pytest
+
+from compositeheap import CompositeFibHeap, PriorityPacker
+
+
+def test_fifo_union_keeps_insertion_order_with_a_shared_packer():
+    packer = PriorityPacker([float], fifo=True)
+    first = CompositeFibHeap(packer)
+    second = CompositeFibHeap(packer)
+    first.insert("a1", (1.0,))
+    first.insert("a2", (1.0,))
+    second.insert("b1", (1.0,))
+    second.insert("b2", (1.0,))
+
+    merged = first.fib_Union(second)
+    order = [merged.extractMin().key for _ in range(4)]
+    assert order == ["a1", "a2", "b1", "b2"]
+
+
+def test_fifo_union_rejects_separate_packers():
+    first = CompositeFibHeap(PriorityPacker([float], fifo=True))
+    second = CompositeFibHeap(PriorityPacker([float], fifo=True))
+    first.insert("a1", (1.0,))
+    second.insert("b1", (1.0,))
+    with pytest.raises(ValueError):
+        first.fib_Union(second)
+
+
+def test_update_and_decrease_key_pack_once():
+    heap = CompositeFibHeap(PriorityPacker([float, 8]), debug=True)
+    heap.insert("a", (3.0, 1))
+    heap.insert("b", (5.0, 2))
+    heap.update("b", (1.0, 7))
+    heap.decrease_key("a", (0.5, 4))
+    heap.update("a", (9.0, 0))
+    assert heap.priority_of("a") == (9.0, 0)
+    assert heap.priority_of("b") == (1.0, 7)
+    with pytest.raises(ValueError):
+        heap.update("a", 5)
+    assert heap.extractMin().key == "b"
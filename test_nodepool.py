@@ -0,0 +1,50 @@
+import pytest
+
+from fibonacciHeap import FibHeap
+from nodepool import NodePool
+
+
+def test_update_after_discard_keeps_live_node_out_of_pool():
+    pool = NodePool()
+    heap = FibHeap(pool=pool, debug=True)
+    for key in range(10):
+        heap.insert(key, key)
+    heap.extractMin()
+    heap.discard(5)
+    node = heap.update(3, 100)  # consolidates, which purges the tombstone of 5
+
+    assert node not in pool.nodes
+    assert pool.dropped == 0
+    assert len(pool.nodes) == 1  # only the purged tombstone
+
+    removed = heap.delete(3)
+    assert removed is node
+    heap.release(removed)
+    assert list(pool.nodes).count(node) == 1
+
+
+def test_extracted_nodes_are_reused_only_after_release():
+    pool = NodePool()
+    heap = FibHeap(pool=pool)
+    for key in range(4):
+        heap.insert(key, key)
+    held = heap.extractMin()
+    fresh = heap.insert(10, 10.0)
+    assert fresh is not held
+    assert (held.key, held.priority) == (0, 0)
+
+    heap.release(held)
+    assert heap.insert(11, 11.0) is held
+    assert pool.hits == 1
+
+
+def test_release_rejects_live_and_released_nodes():
+    heap = FibHeap(pool=NodePool())
+    live = heap.insert("a", 1.0)
+    with pytest.raises(ValueError):
+        heap.release(live)
+
+    node = heap.extractMin()
+    heap.release(node)
+    with pytest.raises(ValueError):
+        heap.release(node)
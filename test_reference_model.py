@@ -0,0 +1,82 @@
+import random
+
+import pytest
+
+from fibonacciHeap import FibHeap
+from priorityqueue import BACKENDS, MergeablePriorityQueue, make_priority_queue
+
+# every backend, plus a FibHeap that audits its invariants after each operation
+FACTORIES = {name: (lambda name=name: make_priority_queue(name)) for name in BACKENDS}
+FACTORIES["fibonacci-debug"] = lambda: FibHeap(debug=True)
+
+
+def run_reference_model(factory, seed, steps=2000):
+    """
+    Drives a queue with a random mix of operations and checks every result against a
+    dict mapping key -> priority.
+
+    Priorities are ints that never go below the last extracted minimum, so the same
+    sequences are valid for the monotone radix backend.
+    """
+    rng = random.Random(seed)
+    queue = factory()
+    assert isinstance(queue, MergeablePriorityQueue)
+    reference = {}
+    floor = 0  # the last extracted minimum
+    next_key = 0
+
+    for step in range(steps):
+        op = rng.random()
+        if op < 0.35 or not reference:
+            priority = floor + rng.randint(0, 100)
+            queue.insert(next_key, priority)
+            reference[next_key] = priority
+            next_key += 1
+        elif op < 0.5:
+            node = queue.extractMin()
+            assert node.priority == min(reference.values())
+            assert reference.pop(node.key) == node.priority
+            floor = node.priority
+        elif op < 0.65:
+            key = rng.choice(list(reference))
+            priority = max(floor, reference[key] - rng.randint(0, 30))
+            queue.decrease_key(key, priority)
+            reference[key] = priority
+        elif op < 0.72:
+            key = rng.choice(list(reference))
+            node = queue.delete(key if rng.random() < 0.5 else queue.lookup(key))
+            assert node.key == key
+            del reference[key]
+        elif op < 0.8:
+            key = rng.choice(list(reference) + [f"new-{step}"])
+            priority = floor + rng.randint(0, 100)
+            queue.update(key, priority)
+            reference[key] = priority
+        elif op < 0.85:
+            other = factory()
+            for _ in range(rng.randint(0, 8)):
+                priority = floor + rng.randint(0, 100)
+                other.insert(next_key, priority)
+                reference[next_key] = priority
+                next_key += 1
+            queue = queue.fib_Union(other)
+        else:
+            key = rng.choice(list(reference))
+            assert key in queue
+            assert queue.priority_of(key) == reference[key]
+            assert queue.getMin().priority == min(reference.values())
+
+        assert len(queue) == len(reference)
+        assert set(queue.index) == set(reference)
+
+    drained = []
+    while not queue.isEmpty():
+        drained.append(queue.extractMin().priority)
+    assert drained == sorted(reference.values())
+    assert queue.getMin() is None
+
+
+@pytest.mark.parametrize("seed", range(3))
+@pytest.mark.parametrize("backend", sorted(FACTORIES))
+def test_matches_reference_model(backend, seed):
+    run_reference_model(FACTORIES[backend], seed)